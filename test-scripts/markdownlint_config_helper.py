@@ -2,44 +2,122 @@
 Shared helper for test-scripts: create and use an alternate markdownlint config.
 
 The config file is created in the repo's tmp/ dir (so markdownlint-cli2 resolves
-custom rule paths correctly) and removed when the context exits.
+custom rule paths correctly). Files are named by a hash of their content, reused by
+later calls with the same options, and removed when the process exits.
+
+When markdownlint-cli2 is installed in node_modules, lint runs go through one long-lived
+Node worker (markdownlint_worker.mjs) instead of a new process per run; if the worker dies
+or sends a broken reply, it is dropped and later runs spawn the CLI. Set
+MARKDOWNLINT_WORKER=0 to always spawn the CLI. Set MARKDOWNLINT_TEST_CACHE=1 to reuse
+non-fix lint results across test runs, keyed by config, file content, the files under
+markdownlint-rules/, and the installed markdownlint versions.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
+import functools
+import hashlib
 import json
+import os
+import re
+import shutil
 import subprocess  # nosec B404
+import tempfile
+import threading
+import unittest
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Iterator, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Iterator, Optional, Tuple, Union
 from uuid import uuid4
 
 import yaml
+from verify_markdownlint_fixtures import find_markdownlint_cmd, load_via_json_sidecar
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when orjson is not installed
+    orjson = None
+
 
-from verify_markdownlint_fixtures import find_markdownlint_cmd
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write data to path with raw os.open/os.write (no text layer, no fsync)."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(str(path), flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
 def _repo_root() -> Path:
     """Repository root (parent of test-scripts)."""
     return Path(__file__).resolve().parents[1]
 
 
+# Parsed config files keyed by (path, st_mtime_ns); reloaded only when the file changes.
+_CONFIG_CACHE: Dict[Tuple[str, int], Any] = {}
+
+
+def _cached_load(path: Path, load: Callable[[Path], Any]) -> Any:
+    """Return load(path), reusing the cached result while the file is unchanged.
+
+    A deep copy is returned so callers can never mutate the cached object.
+    """
+    key = (str(path), path.stat().st_mtime_ns)
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[key] = load(path)
+    return copy.deepcopy(_CONFIG_CACHE[key])
+
+
+def _load_yaml_via_sidecar(path: Path) -> Any:
+    """Load a YAML file through the verifier's JSON sidecar cache in repo tmp/."""
+    return load_via_json_sidecar(path, yaml.safe_load)
+
+
+def _read_jsonc_options(path: Path) -> Dict[str, Any]:
+    """Parse .markdownlint-cli2.jsonc content; empty content means no options."""
+    if not path.stat().st_size:
+        return {}
+    data = path.read_bytes()
+    return _loads(data) if data.strip() else {}
+
+
 def _load_base_config() -> Dict[str, Any]:
     """Load the repo's .markdownlint.yml as the base config."""
     path = _repo_root() / ".markdownlint.yml"
     if not path.exists():
         return {"default": True}
-    text = path.read_text(encoding="utf-8")
-    data = yaml.safe_load(text)
+    data = _cached_load(path, _load_yaml_via_sidecar)
     return data if isinstance(data, dict) else {"default": True}
 
 
 def _merge_overrides(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge overrides into base (top-level keys replaced, not deep-merged)."""
-    result = dict(base)
-    for key, value in overrides.items():
-        result[key] = value
-    return result
+    """
+    Merge overrides into base (top-level keys replaced, not deep-merged).
+
+    Returns a new shallow dict; nested values are shared with base and overrides, so
+    callers must not mutate the result in place.
+    """
+    return {**base, **overrides}
 
 
 def _load_cli2_options() -> Dict[str, Any]:
@@ -47,8 +125,23 @@ def _load_cli2_options() -> Dict[str, Any]:
     path = _repo_root() / ".markdownlint-cli2.jsonc"
     if not path.exists():
         return {}
-    text = path.read_text(encoding="utf-8")
-    return json.loads(text) if text.strip() else {}
+    return _cached_load(path, _read_jsonc_options)
+
+
+@functools.lru_cache(maxsize=4)
+def _cli2_resolved(root_str: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Return (absolute customRules paths, ignores without tmp/**) from the repo cli2 config.
+
+    Keyed by the config's mtime (-1 when absent) so rule paths are resolved once per edit.
+    """
+    del mtime_ns  # cache key only
+    root = Path(root_str)
+    cli2 = _load_cli2_options()
+    abs_rules = tuple(str((root / p).resolve()) for p in cli2.get("customRules") or [])
+    # Omit tmp/** so test files in repo tmp/ are linted when cwd=tmp.
+    ignores = tuple(i for i in cli2.get("ignores") or [] if i != "tmp/**")
+    return abs_rules, ignores
 
 
 def _repo_tmp_dir() -> Path:
@@ -58,6 +151,135 @@ def _repo_tmp_dir() -> Path:
     return p
 
 
+# Config files written by _materialize_config, keyed by a hash of their content.
+_WRITTEN_CONFIGS: Dict[str, Path] = {}
+# Config paths keyed by the overrides that produced them (compact JSON with sorted keys).
+_MATERIALIZED: Dict[str, Path] = {}
+_WRITE_LOCK = threading.Lock()
+
+
+def _remove_written_configs() -> None:
+    """Delete every config file written by this process (registered with atexit)."""
+    for path in _WRITTEN_CONFIGS.values():
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    _WRITTEN_CONFIGS.clear()
+    _MATERIALIZED.clear()
+
+
+atexit.register(_remove_written_configs)
+
+
+def _materialize_config(overrides: Dict[str, Any] | None = None) -> Path:
+    """
+    Return the path of a cli2 config file for overrides, writing it on first use.
+
+    Repeat calls with equal overrides skip loading, merging and serializing entirely.
+    Files with identical content are shared; all are removed at process exit.
+    """
+    overrides_dict = overrides or {}
+    memo_key = json.dumps(overrides_dict, sort_keys=True, separators=(",", ":"))
+    cached = _MATERIALIZED.get(memo_key)
+    if cached is not None and cached.exists():
+        return cached
+    root = _repo_root()
+    # When overrides set default: False, use minimal base so only the overridden rule runs.
+    if overrides_dict.get("default") is False:
+        base = {"default": False}
+    else:
+        base = _load_base_config()
+    config = _merge_overrides(base, overrides_dict)
+    cli2_path = root / ".markdownlint-cli2.jsonc"
+    cli2_mtime_ns = cli2_path.stat().st_mtime_ns if cli2_path.exists() else -1
+    abs_rules, ignores = _cli2_resolved(str(root), cli2_mtime_ns)
+    options = {"config": config, "customRules": list(abs_rules), "ignores": list(ignores)}
+    payload = _dumps_indented(options)
+    key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    # Locked so threads sharing a config never read it while another thread rewrites it.
+    with _WRITE_LOCK:
+        config_path = _WRITTEN_CONFIGS.get(key)
+        if config_path is None or not config_path.exists():
+            # Name by content so identical options share one file and different ones never
+            # collide; the pid keeps parallel test processes from removing each other's files.
+            config_path = _repo_tmp_dir() / f"{key}.{os.getpid()}.markdownlint-cli2.jsonc"
+            _write_file_bytes(config_path, payload)
+            _WRITTEN_CONFIGS[key] = config_path
+    _MATERIALIZED[memo_key] = config_path
+    return config_path
+
+
+@functools.lru_cache(maxsize=1)
+def _scratch_root() -> Optional[str]:
+    """Parent for scratch dirs: $MDL_TMPDIR, else tmpfs /dev/shm, else the system temp dir."""
+    configured = os.environ.get("MDL_TMPDIR")
+    if configured:
+        os.makedirs(configured, exist_ok=True)
+        return configured
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK):
+        return "/dev/shm"
+    return None
+
+
+def scratch_dir(prefix: str) -> Path:
+    """
+    Create and return a new scratch directory for fixtures linted by absolute path.
+
+    Uses MDL_TMPDIR when set, otherwise /dev/shm (tmpfs) when writable, otherwise the system
+    temp dir. Fixtures linted by repo-relative path must stay in repo tmp/ instead.
+    """
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=_scratch_root()))
+
+
+def write_fixture(path: Path, content: str) -> None:
+    """Write content to path as UTF-8 with raw os.open/os.write (no text I/O layer)."""
+    _write_file_bytes(path, content.encode("utf-8"))
+
+
+@contextmanager
+def scratch_file(path: Path, content: str) -> Iterator[Path]:
+    """Write content to path (UTF-8), yield path, and remove the file afterwards."""
+    write_fixture(path, content)
+    try:
+        yield path
+    finally:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+class ScratchDirTestCase(unittest.TestCase):
+    """
+    Base for tests that lint fixture files in a per-class scratch dir (see scratch_dir()).
+
+    Subclasses set scratch_prefix. Each test gets self._file, named after the test method in
+    that dir; the dir and everything in it is removed after the class. assert_file_content()
+    checks a fixture's text after --fix.
+    """
+
+    scratch_prefix = "mdl_"
+    _tmp: Path
+    _file: Path
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._tmp = scratch_dir(cls.scratch_prefix)
+        cls.addClassCleanup(shutil.rmtree, cls._tmp, ignore_errors=True)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._file = self._tmp / f"{self._testMethodName}.md"
+
+    def assert_file_content(self, path: Path, expected: str, msg: str) -> None:
+        """Assert path holds expected text; compares bytes and decodes only to show a diff."""
+        actual = path.read_bytes()
+        if actual != expected.encode("utf-8"):
+            self.assertEqual(actual.decode("utf-8", errors="replace"), expected, msg)
+
+
 @contextmanager
 def temp_markdownlint_config(overrides: Dict[str, Any] | None = None) -> Iterator[Path]:
     """
@@ -65,7 +287,8 @@ def temp_markdownlint_config(overrides: Dict[str, Any] | None = None) -> Iterato
 
     The file is created in the repo's tmp/ dir so that when run with cwd=tmp, the CLI
     uses only this config (no merge with repo root's .markdownlint-cli2.jsonc).
-    Uses absolute paths for custom rules.
+    Uses absolute paths for custom rules. A call whose overrides match an earlier
+    call reuses that file instead of rewriting it; files are removed at process exit.
 
     Args:
         overrides: Optional dict of rule names to config (e.g. no-heading-like-lines:
@@ -74,33 +297,252 @@ def temp_markdownlint_config(overrides: Dict[str, Any] | None = None) -> Iterato
     Yields:
         Path to the temporary config file.
     """
-    root = _repo_root().resolve()
-    # When overrides set default: False, use minimal base so only the overridden rule runs.
-    overrides_dict = overrides or {}
-    if overrides_dict.get("default") is False:
-        base = {"default": False}
-    else:
-        base = _load_base_config()
-    config = _merge_overrides(base, overrides_dict)
-    cli2 = _load_cli2_options()
-    custom_rules_raw = cli2.get("customRules") or []
-    abs_rules = [str((root / p).resolve()) for p in custom_rules_raw]
-    ignores = cli2.get("ignores") or []
-    # Omit tmp/** so test files in repo tmp/ are linted when cwd=tmp.
-    ignores = [i for i in ignores if i != "tmp/**"]
-    options = {"config": config, "customRules": abs_rules, "ignores": ignores}
-    config_dir = _repo_tmp_dir()
-    # Use a unique file name per invocation so repeated test runs never collide.
-    config_path = config_dir / f"{uuid4().hex}.markdownlint-cli2.jsonc"
-    config_path.write_text(json.dumps(options, indent=2), encoding="utf-8")
-    try:
-        yield config_path
-    finally:
-        if config_path.exists():
+    yield _materialize_config(overrides)
+
+
+class _MarkdownlintWorker:
+    """A long-lived Node process running markdownlint-cli2 jobs sent as JSON lines."""
+
+    def __init__(self, node: str, script: Path) -> None:
+        self._proc = subprocess.Popen(  # pylint: disable=consider-using-with
+            [node, str(script)],
+            cwd=str(_repo_root()),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )  # nosec B603
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def run(
+        self,
+        args: List[str],
+        cwd: Path,
+        contents: Optional[Dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run markdownlint-cli2 with args as if from cwd; return a CompletedProcess.
+
+        contents maps identifiers to Markdown text linted in memory (cli2 nonFileContents).
+        Raises OSError when the worker is gone or its reply is not a result line (e.g. a rule
+        wrote to stdout); the worker must not be used after that.
+        """
+        request: Dict[str, Any] = {"directory": str(cwd), "argv": args}
+        if contents:
+            request["nonFileContents"] = contents
+        job = json.dumps(request)
+        with self._lock:
+            if self._proc.stdin is None or self._proc.stdout is None:
+                raise OSError("markdownlint worker is not running")
             try:
-                config_path.unlink()
-            except OSError:
-                pass
+                self._proc.stdin.write(job + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except ValueError as e:  # pipe already closed
+                raise OSError("markdownlint worker is not running") from e
+        if not line:
+            raise OSError("markdownlint worker exited unexpectedly")
+        try:
+            result = _loads(line)
+            return subprocess.CompletedProcess(
+                args=["markdownlint-cli2", *args],
+                returncode=result["returncode"],
+                stdout=result["stdout"],
+                stderr=result["stderr"],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise OSError(f"markdownlint worker sent an invalid reply: {line[:200]!r}") from e
+
+    def close(self) -> None:
+        """Close the worker's stdin so it exits, then reap it."""
+        if self._proc.poll() is None:
+            if self._proc.stdin is not None:
+                self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+    def kill(self) -> None:
+        """Kill the worker without waiting for pending jobs (e.g. after a broken reply)."""
+        if self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+
+
+@functools.lru_cache(maxsize=1)
+def _markdownlint_cmd() -> Tuple[str, ...]:
+    """find_markdownlint_cmd() resolved once per process, with the executable made absolute."""
+    cmd = find_markdownlint_cmd()
+    return (shutil.which(cmd[0]) or cmd[0], *cmd[1:])
+
+
+_WORKER_LOCK = threading.Lock()
+# Set once the shared worker failed a job; every later run spawns the CLI instead.
+_WORKER_DEAD = threading.Event()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_worker() -> Optional[_MarkdownlintWorker]:
+    """Start the shared worker once; None when node or local markdownlint-cli2 is missing."""
+    node = shutil.which("node")
+    installed = _repo_root() / "node_modules" / "markdownlint-cli2" / "package.json"
+    if node is None or not installed.exists():
+        return None
+    return _MarkdownlintWorker(node, Path(__file__).with_name("markdownlint_worker.mjs"))
+
+
+def _get_worker() -> Optional[_MarkdownlintWorker]:
+    """Return the shared worker, starting it on first use; None if it cannot be used."""
+    if os.environ.get("MARKDOWNLINT_WORKER") == "0" or _WORKER_DEAD.is_set():
+        return None
+    with _WORKER_LOCK:
+        return _shared_worker()
+
+
+def _drop_worker(worker: _MarkdownlintWorker) -> None:
+    """Stop using the shared worker after it failed a job and kill it."""
+    _WORKER_DEAD.set()
+    worker.kill()
+
+
+def start_markdownlint_worker() -> bool:
+    """
+    Start the shared worker ahead of the first lint run (e.g. from setUpModule).
+
+    Returns True when lint runs will go through the worker, False when they spawn the CLI.
+    """
+    return _get_worker() is not None
+
+
+def run_markdownlint(args: List[str], cwd: Path) -> subprocess.CompletedProcess:
+    """
+    Run markdownlint-cli2 with args (paths and flags) from cwd.
+
+    Uses the shared worker when available, otherwise spawns the (cached) markdownlint command.
+    If the worker fails a job, it is dropped and this and every later run spawn the command.
+    Returns the CompletedProcess; caller checks returncode and stdout/stderr.
+    """
+    worker = _get_worker()
+    if worker is not None:
+        try:
+            return worker.run(args, cwd)
+        except OSError:
+            _drop_worker(worker)
+    # CPython only uses posix_spawn without cwd (and, before 3.13, without close_fds), and the
+    # CLI must run from cwd, so this spawn takes the vfork+exec path (3.10+ on Linux), which
+    # also skips copying the parent's page tables. An absolute executable avoids a PATH search.
+    return subprocess.run(
+        [*_markdownlint_cmd(), *args],
+        cwd=str(cwd),
+        text=True,
+        capture_output=True,
+        check=False,
+    )  # nosec B603
+
+
+def combined_output(proc: subprocess.CompletedProcess) -> str:
+    """Return proc's stdout followed by its stderr, computed once and kept on proc."""
+    combined = getattr(proc, "_combined_output", None)
+    if combined is None:
+        combined = (proc.stdout or "") + (proc.stderr or "")
+        setattr(proc, "_combined_output", combined)
+    return combined
+
+
+# Rule names of a markdownlint-cli2 result line, as in verify_markdownlint_fixtures.
+_RESULT_RULES_RE = re.compile(r"^[^:\n]+:\d+(?::\d+)?\s+(?:error\s+)?(\S+)\s", re.MULTILINE)
+
+
+def rules_present(output: str) -> FrozenSet[str]:
+    """Return every rule name and alias reported in markdownlint-cli2 output, in one pass."""
+    return frozenset(
+        name for match in _RESULT_RULES_RE.finditer(output) for name in match.group(1).split("/")
+    )
+
+
+def _result_cache_enabled() -> bool:
+    """True when MARKDOWNLINT_TEST_CACHE=1 opts in to reusing lint results across runs."""
+    return os.environ.get("MARKDOWNLINT_TEST_CACHE") == "1"
+
+
+def _installed_version(package_json: Path) -> str:
+    """Version field of an installed npm package's package.json, or "-" when absent."""
+    try:
+        return str(_loads(package_json.read_bytes())["version"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return "-"
+
+
+def _lint_inputs_fingerprint() -> bytes:
+    """Fingerprint of everything besides config and content that affects lint results."""
+    root = _repo_root()
+    cli2_path = root / ".markdownlint-cli2.jsonc"
+    cli2_mtime_ns = cli2_path.stat().st_mtime_ns if cli2_path.exists() else -1
+    rules, _ = _cli2_resolved(str(root), cli2_mtime_ns)
+    # Every file under markdownlint-rules/, not just customRules: rules require shared
+    # modules such as utils.js.
+    rule_files = {str(p) for p in (root / "markdownlint-rules").rglob("*") if p.is_file()}
+    parts = []
+    for p in (*sorted(rule_files.union(rules)), str(cli2_path)):
+        try:
+            st = os.stat(p)
+            parts.append(f"{p}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append(f"{p}:-")
+    modules = root / "node_modules"
+    for package in (
+        "markdownlint-cli2",
+        "markdownlint",
+        "markdownlint-cli2/node_modules/markdownlint",
+    ):
+        parts.append(f"{package}@{_installed_version(modules / package / 'package.json')}")
+    return "\n".join(parts).encode("utf-8")
+
+
+def _cached_result(
+    key_parts: List[bytes],
+    run: Callable[[], subprocess.CompletedProcess],
+) -> subprocess.CompletedProcess:
+    """
+    Return run(), or a stored result for the same key when MARKDOWNLINT_TEST_CACHE=1.
+
+    The key covers key_parts (config and file contents) plus every file under
+    markdownlint-rules/ and the installed markdownlint versions, so editing a rule or a
+    shared module (e.g. utils.js) or upgrading markdownlint invalidates it. Results are
+    stored as JSON in repo tmp/markdownlint-cache/.
+    """
+    if not _result_cache_enabled():
+        return run()
+    digest = hashlib.blake2b(_lint_inputs_fingerprint(), digest_size=16)
+    for part in key_parts:
+        digest.update(b"\0")
+        digest.update(part)
+    cache_dir = _repo_tmp_dir() / "markdownlint-cache"
+    entry = cache_dir / f"{digest.hexdigest()}.json"
+    try:
+        data = _loads(entry.read_bytes())
+        return subprocess.CompletedProcess(
+            data["args"], data["returncode"], data["stdout"], data["stderr"]
+        )
+    except (OSError, ValueError, KeyError):
+        pass
+    proc = run()
+    data = {
+        "args": list(proc.args),
+        "returncode": proc.returncode,
+        "stdout": proc.stdout,
+        "stderr": proc.stderr,
+    }
+    cache_dir.mkdir(exist_ok=True)
+    partial = entry.with_name(f"{entry.name}.{uuid4().hex}")
+    try:
+        _write_file_bytes(partial, json.dumps(data).encode("utf-8"))
+        os.replace(partial, entry)
+    except OSError:
+        partial.unlink(missing_ok=True)
+    return proc
 
 
 def run_markdownlint_with_config(
@@ -109,42 +551,137 @@ def run_markdownlint_with_config(
     fix: bool = False,
 ) -> subprocess.CompletedProcess:
     """
-    Run markdownlint-cli2 with a temp config (base + config_overrides), then clean up.
+    Run markdownlint-cli2 with a temp config (base + config_overrides).
 
     Config is written to repo tmp/ and run with cwd=repo/tmp so the CLI does not merge
     with repo root config (which would overwrite customRules). Paths under repo/tmp
-    (e.g. "tmp/foo.md" or Path(repo/tmp/foo.md)) are passed as "foo.md"; other paths
-    are passed as-is (e.g. absolute).
+    (e.g. "tmp/foo.md" or Path(repo/tmp/foo.md), matched without resolving symlinks) are
+    passed as "foo.md"; other paths are passed as-is (e.g. absolute).
 
     Returns the CompletedProcess; caller checks returncode and stdout/stderr.
     """
     if isinstance(paths, (Path, str)):
         paths = [paths]
     tmp_dir = _repo_tmp_dir()
+    # Resolved once; paths are matched by string prefix instead of resolving each one.
+    tmp_prefix = str(tmp_dir.resolve()) + os.sep
 
     def _path_arg(p: Union[Path, str]) -> str:
         s = str(p)
         if s.startswith("tmp/"):
             return s[4:]  # tmp/foo.md -> foo.md
-        try:
-            pp = Path(p).resolve()
-            if tmp_dir.resolve() in pp.parents or pp.parent == tmp_dir.resolve():
-                return pp.name
-        except (OSError, ValueError):
-            pass
+        if s.startswith(tmp_prefix):
+            return Path(s).name
         return s
 
     path_strs = [_path_arg(p) for p in paths]
-    cmd = find_markdownlint_cmd()
-    with temp_markdownlint_config(config_overrides) as config_path:
-        run_cmd = [*cmd, "--config", str(config_path.resolve())]
-        if fix:
-            run_cmd.append("--fix")
-        run_cmd.extend(path_strs)
-        return subprocess.run(
-            run_cmd,
-            cwd=str(tmp_dir),
-            text=True,
-            capture_output=True,
-            check=False,
-        )  # nosec B603
+    config_path = _materialize_config(config_overrides)
+    args = ["--config", str(config_path)]
+    if fix:
+        args.append("--fix")
+        args.extend(path_strs)
+        return run_markdownlint(args, tmp_dir)
+    args.extend(path_strs)
+    if not _result_cache_enabled():
+        return run_markdownlint(args, tmp_dir)
+    try:
+        key_parts = [config_path.read_bytes()]
+        for arg in path_strs:
+            key_parts += [arg.encode("utf-8"), (tmp_dir / arg).read_bytes()]
+    except OSError:
+        return run_markdownlint(args, tmp_dir)
+    return _cached_result(key_parts, lambda: run_markdownlint(args, tmp_dir))
+
+
+def fix_expecting_changes(
+    path: Path,
+    rule: str,
+    run: Callable[..., subprocess.CompletedProcess],
+) -> subprocess.CompletedProcess:
+    """
+    Run markdownlint --fix once via run(path, fix=True) and fail unless it changed path.
+
+    A changed file proves lint errors were reported, so no separate lint-only run is
+    needed; run(path, fix=False) is called only to explain a failure in terms of rule.
+    """
+    before = path.read_bytes()
+    proc_fix = run(path, fix=True)
+    if path.read_bytes() == before:
+        proc = run(path, fix=False)
+        raise AssertionError(
+            f"expected {rule} fixes but file is unchanged:\n{proc.stdout}\n{proc.stderr}"
+        )
+    return proc_fix
+
+
+def run_markdownlint_batch(
+    config_overrides: Dict[str, Any],
+    paths: List[Union[Path, str]],
+) -> Dict[str, subprocess.CompletedProcess]:
+    """
+    Lint several files with one temp config in a single markdownlint-cli2 run.
+
+    Returns a CompletedProcess per path, keyed by str(path). Each holds only the output
+    lines that name that file (matched by file name, so names must be unique in a batch);
+    its returncode is 1 when it has any, else 0. If the run itself failed (returncode
+    other than 0 or 1, or 1 with no line naming a requested file), every entry carries
+    that returncode and the full output.
+    """
+    names = [Path(str(p)).name for p in paths]
+    if len(set(names)) != len(names):
+        raise ValueError("run_markdownlint_batch needs unique file names")
+    proc = run_markdownlint_with_config(config_overrides, list(paths))
+    by_name: Dict[str, Dict[str, List[str]]] = {n: {"stdout": [], "stderr": []} for n in names}
+    attributed = False
+    if proc.returncode in (0, 1):
+        for stream in ("stdout", "stderr"):
+            for line in (getattr(proc, stream) or "").splitlines(keepends=True):
+                # Result lines look like "<path>:<line>[:<column>] <rule> <description>".
+                name = Path(line.split(":", 1)[0]).name
+                if name in by_name:
+                    by_name[name][stream].append(line)
+                    attributed = True
+    if proc.returncode not in (0, 1) or (proc.returncode == 1 and not attributed):
+        failed = (proc.returncode, proc.stdout, proc.stderr)
+        return {str(p): subprocess.CompletedProcess(proc.args, *failed) for p in paths}
+    results = {}
+    for p, name in zip(paths, names):
+        out, err = "".join(by_name[name]["stdout"]), "".join(by_name[name]["stderr"])
+        results[str(p)] = subprocess.CompletedProcess(
+            proc.args, 1 if out or err else 0, out, err
+        )
+    return results
+
+
+def run_markdownlint_on_text(
+    config_overrides: Dict[str, Any],
+    name: str,
+    content: str,
+) -> subprocess.CompletedProcess:
+    """
+    Lint content as Markdown named name with a temp config (base + config_overrides).
+
+    With the worker the text is linted in memory and never written to disk; otherwise it
+    is written to a pid-named file in repo tmp/ for the run. Lint only (no --fix).
+    """
+    config_path = _materialize_config(config_overrides)
+
+    def _run() -> subprocess.CompletedProcess:
+        worker = _get_worker()
+        if worker is not None:
+            args = ["--config", str(config_path)]
+            try:
+                return worker.run(args, _repo_tmp_dir(), contents={name: content})
+            except OSError:
+                _drop_worker(worker)
+        path = _repo_tmp_dir() / f"{os.getpid()}.{name}"
+        write_fixture(path, content)
+        try:
+            return run_markdownlint(["--config", str(config_path), path.name], _repo_tmp_dir())
+        finally:
+            path.unlink(missing_ok=True)
+
+    if not _result_cache_enabled():
+        return _run()
+    key_parts = [config_path.read_bytes(), name.encode("utf-8"), content.encode("utf-8")]
+    return _cached_result(key_parts, _run)
@@ -0,0 +1,39 @@
+// Long-lived markdownlint-cli2 worker used by the Python test helpers.
+//
+// Reads newline-delimited JSON jobs from stdin:
+//   { "directory": string, "argv": string[], "nonFileContents"?: { [name]: string } }
+// (nonFileContents is Markdown text linted in memory), runs each through markdownlint-cli2's
+// programmatic main(), and writes one JSON line
+// ({ "returncode": number, "stdout": string, "stderr": string }) per job to stdout.
+// Keeping one Node process alive avoids paying Node startup and rule loading per lint run.
+// Jobs are handled strictly in order, one at a time.
+
+import { createInterface } from "node:readline";
+import { main } from "markdownlint-cli2";
+
+const runJob = async (job) => {
+  const stdout = [];
+  const stderr = [];
+  let returncode;
+  try {
+    returncode = await main({
+      directory: job.directory,
+      argv: job.argv,
+      nonFileContents: job.nonFileContents,
+      logMessage: (msg) => stdout.push(`${msg}\n`),
+      logError: (msg) => stderr.push(`${msg}\n`),
+    });
+  } catch (error) {
+    stderr.push(`${(error && error.stack) || error}\n`);
+    returncode = 2;
+  }
+  return { returncode, stdout: stdout.join(""), stderr: stderr.join("") };
+};
+
+const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+for await (const line of lines) {
+  if (line.trim()) {
+    const result = await runJob(JSON.parse(line));
+    process.stdout.write(`${JSON.stringify(result)}\n`);
+  }
+}
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests that excludePathPatterns skips each custom rule for matching files.
+
+All fixtures are linted in one markdownlint run whose config enables every rule below
+with its own options plus excludePathPatterns; each fixture must then report no errors.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess  # nosec B404
+import unittest
+from pathlib import Path
+from typing import Dict, Tuple
+
+from markdownlint_config_helper import (
+    combined_output,
+    run_markdownlint_batch,
+    start_markdownlint_worker,
+    write_fixture,
+)
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# rule -> (rule options besides excludePathPatterns, content that violates the rule).
+_CASES: Dict[str, Tuple[dict, str]] = {
+    "document-length": (
+        {"maximum": 10},
+        "# T\n\n- [S](#section)\n\n## Section\n\n"
+        + "".join(f"line {i}\n" for i in range(20)),
+    ),
+    "no-empty-heading": (
+        {},
+        """# T
+
+- [S](#s)
+
+## Section One
+
+""",
+    ),
+    "heading-numbering": (
+        {},
+        """# T
+
+## A
+
+### B
+""",
+    ),
+    "heading-min-words": (
+        {"minWords": 2, "applyToLevelsAtOrBelow": 2},
+        """# T
+
+## A
+""",
+    ),
+    "ascii-only": (
+        {},
+        """# T
+
+## S
+
+café
+""",
+    ),
+    "no-h1-content": (
+        {},
+        """# Title
+
+Some prose under h1.
+""",
+    ),
+    "fenced-code-under-heading": (
+        {"languages": ["go"]},
+        """# T
+
+```go
+x
+```
+""",
+    ),
+    "allow-custom-anchors": (
+        {"allowedIdPatterns": ["^spec-[a-z]+$"]},
+        """# T
+
+- [A](#a)
+
+<a id="disallowed"></a>
+""",
+    ),
+    "no-duplicate-headings-normalized": (
+        {},
+        """# T
+
+- [S](#same)
+- [S2](#same-2)
+
+## Same
+
+x
+
+## Same
+
+y
+""",
+    ),
+    "heading-title-case": (
+        {},
+        """# T
+
+- [A](#all-lowercase-wrong)
+
+## all lowercase wrong
+
+Content.
+""",
+    ),
+}
+
+
+def _fixture_name(rule: str) -> str:
+    """Repo tmp/ file name for rule's fixture; the pid keeps parallel runs apart."""
+    return f"excluded_{rule}.{os.getpid()}.md"
+
+
+def setUpModule() -> None:
+    """Start the shared markdownlint worker before the first test runs."""
+    start_markdownlint_worker()
+
+
+class TestExcludePathPatterns(unittest.TestCase):
+    """excludePathPatterns: every rule skips a matching file (one batched lint run)."""
+
+    _results: Dict[str, subprocess.CompletedProcess]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        tmp = _REPO_ROOT / "tmp"
+        tmp.mkdir(exist_ok=True)
+        config: dict = {"default": False}
+        paths = []
+        for rule, (options, content) in _CASES.items():
+            name = _fixture_name(rule)
+            path = tmp / name
+            write_fixture(path, content)
+            cls.addClassCleanup(path.unlink, missing_ok=True)
+            config[rule] = {**options, "excludePathPatterns": ["**", f"**/{name}"]}
+            paths.append(f"tmp/{name}")
+        cls._results = run_markdownlint_batch(config, paths)
+
+    def test_exclude_path_patterns_skips_rule(self) -> None:
+        for rule in _CASES:
+            with self.subTest(rule=rule):
+                proc = self._results[f"tmp/{_fixture_name(rule)}"]
+                self.assertEqual(proc.returncode, 0, combined_output(proc))
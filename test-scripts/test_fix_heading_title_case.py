@@ -1,41 +1,45 @@
 #!/usr/bin/env python3
 """
-Functional test for heading-title-case fixInfo: generate a file with violations,
-assert markdownlint reports errors, run --fix, then assert file content matches expected.
+Functional test for heading-title-case fixInfo: generate a file with violations, run --fix
+(a changed file proves errors were reported), then assert file content matches expected.
 """
 
 from __future__ import annotations
 
+import os
 import subprocess  # nosec B404
-import tempfile
-import unittest
 from pathlib import Path
 
 import verify_markdownlint_fixtures as v
-from markdownlint_config_helper import run_markdownlint_with_config
+from markdownlint_config_helper import (
+    ScratchDirTestCase,
+    fix_expecting_changes,
+    run_markdownlint,
+    run_markdownlint_with_config,
+    scratch_file,
+    start_markdownlint_worker,
+    write_fixture,
+)
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 RULE = "heading-title-case"
 
 
 def _run_markdownlint(path: Path, fix: bool = False) -> subprocess.CompletedProcess:
-    cmd = v.find_markdownlint_cmd()
-    if fix:
-        cmd = [*cmd, "--fix", str(path)]
-    else:
-        cmd = [*cmd, str(path)]
-    return subprocess.run(
-        cmd,
-        cwd=v.repo_root(),
-        text=True,
-        capture_output=True,
-        check=False,
-    )  # nosec B603
-
-
-class TestFixHeadingTitleCase(unittest.TestCase):
+    args = ["--fix", str(path)] if fix else [str(path)]
+    return run_markdownlint(args, v.repo_root())
+
+
+def setUpModule() -> None:
+    """Start the shared markdownlint worker before the first test runs."""
+    start_markdownlint_worker()
+
+
+class TestFixHeadingTitleCase(ScratchDirTestCase):
     """Test that heading-title-case fixInfo is applied by markdownlint --fix."""
 
+    scratch_prefix = "fix_heading_title_case_"
+
     def test_fix_applied_and_file_updated(self) -> None:
         content_before = """# Title
 
@@ -65,26 +69,18 @@ Middle "And" should be lowercase.
 
 Last word "practice" should be capitalized.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-
-            # Must report errors before fix
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            combined = (proc.stdout or "") + "\n" + (proc.stderr or "")
-            self.assertIn(RULE, combined, f"expected {RULE} in output")
-
-            # Apply fix
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-
-            # File content must match expected after fix
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "file content after --fix should match expected",
-            )
+        path = self._file
+        write_fixture(path, content_before)
+
+        # Apply fix; a changed file proves errors were reported before the fix
+        proc_fix = fix_expecting_changes(path, RULE, _run_markdownlint)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+
+        # File content must match expected after fix
+        self.assert_file_content(
+            path, content_after,
+            "file content after --fix should match expected",
+        )
 
     def test_fix_heading_with_backticks_and_parentheses(self) -> None:
         """Heading with inline code (backticks) and parens: fix must target correct words."""
@@ -94,19 +90,16 @@ Last word "practice" should be capitalized.
 
 Text.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("`# noqa: E402`", actual, "inline code (backticks) must be preserved")
-            self.assertIn("(Module ", actual, "(module -> (Module at correct position")
-            self.assertIn(" of File)", actual, "file must be fixed to File (last word)")
-            self.assertNotIn("(module ", actual, "(module should have been fixed")
-            self.assertNotIn(" of file)", actual, "file should have been fixed to File")
+        path = self._file
+        write_fixture(path, content_before)
+        proc_fix = fix_expecting_changes(path, RULE, _run_markdownlint)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertIn("`# noqa: E402`", actual, "inline code (backticks) must be preserved")
+        self.assertIn("(Module ", actual, "(module -> (Module at correct position")
+        self.assertIn(" of File)", actual, "file must be fixed to File (last word)")
+        self.assertNotIn("(module ", actual, "(module should have been fixed")
+        self.assertNotIn(" of file)", actual, "file should have been fixed to File")
 
     def test_scientific_notation_5e_and_hyphen_compound_unchanged(self) -> None:
         """5e and Follow-Up in headings pass lint and are unchanged by --fix."""
@@ -120,16 +113,17 @@ Scientific notation 5e is not title-cased.
 
 Hyphenated compound: each segment capitalized.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertEqual(proc.returncode, 0, f"5e and Follow-Up should pass: {proc.stderr}")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("5e", actual, "5e must be preserved (scientific notation)")
-            self.assertIn("Follow-Up", actual, "Follow-Up must stay capitalized (hyphen compound)")
+        path = self._file
+        write_fixture(path, content)
+        # Exit 0 with unchanged content after one --fix run means lint passed.
+        proc_fix = _run_markdownlint(path, fix=True)
+        self.assertEqual(
+            proc_fix.returncode, 0, f"5e and Follow-Up should pass: {proc_fix.stderr}"
+        )
+        actual = path.read_text(encoding="utf-8")
+        self.assertEqual(actual, content, "--fix must not change a passing file")
+        self.assertIn("5e", actual, "5e must be preserved (scientific notation)")
+        self.assertIn("Follow-Up", actual, "Follow-Up must stay capitalized (hyphen compound)")
 
     def test_alphanumeric_identifier_4a_unchanged_by_fix(self) -> None:
         """Alphanumeric identifiers (e.g. 4a) in headings pass lint and are unchanged by --fix."""
@@ -139,15 +133,14 @@ Hyphenated compound: each segment capitalized.
 
 Alphanumeric 4a is not title-cased.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertEqual(proc.returncode, 0, f"4a heading should pass: {proc.stderr}")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("4a", actual, "4a must be preserved (alphanumeric identifier)")
+        path = self._file
+        write_fixture(path, content)
+        # Exit 0 with unchanged content after one --fix run means lint passed.
+        proc_fix = _run_markdownlint(path, fix=True)
+        self.assertEqual(proc_fix.returncode, 0, f"4a heading should pass: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertEqual(actual, content, "--fix must not change a passing file")
+        self.assertIn("4a", actual, "4a must be preserved (alphanumeric identifier)")
 
     def test_phase_a_label_unchanged_by_fix(self) -> None:
         """Single letter after 'Phase' is a label; --fix must not lowercase it."""
@@ -161,15 +154,16 @@ Overview.
 
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertEqual(proc.returncode, 0, f"Phase A heading should pass lint: {proc.stderr}")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("Phase A:", actual, "Phase A must remain capitalized after --fix")
+        path = self._file
+        write_fixture(path, content)
+        # Exit 0 with unchanged content after one --fix run means lint passed.
+        proc_fix = _run_markdownlint(path, fix=True)
+        self.assertEqual(
+            proc_fix.returncode, 0, f"Phase A heading should pass lint: {proc_fix.stderr}"
+        )
+        actual = path.read_text(encoding="utf-8")
+        self.assertEqual(actual, content, "--fix must not change a passing file")
+        self.assertIn("Phase A:", actual, "Phase A must remain capitalized after --fix")
 
     def test_fix_identifier_with_underscore_gets_backticks(self) -> None:
         """Identifiers with underscores (e.g. sba_result, my_var) get backticks, not title case."""
@@ -193,18 +187,14 @@ Identifier should be in backticks.
 
 Variable name in heading.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "identifiers with underscores get backticks",
-            )
+        path = self._file
+        write_fixture(path, content_before)
+        proc_fix = fix_expecting_changes(path, RULE, _run_markdownlint)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        self.assert_file_content(
+            path, content_after,
+            "identifiers with underscores get backticks",
+        )
 
     def test_heading_with_link_passes_lint_and_fix_preserves_link(self) -> None:
         """Heading with [text](path) passes; link text/path ignored; --fix leaves link unchanged."""
@@ -214,19 +204,20 @@ Variable name in heading.
 
 Link text and path are not title-cased.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertEqual(proc.returncode, 0, f"heading with link should pass: {proc.stderr}")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn(
-                "[Getting Started](docs/getting-started.md)", actual, "link preserved"
-            )
-            self.assertIn("See ", actual)
-            self.assertIn(" for More", actual)
+        path = self._file
+        write_fixture(path, content)
+        # Exit 0 with unchanged content after one --fix run means lint passed.
+        proc_fix = _run_markdownlint(path, fix=True)
+        self.assertEqual(
+            proc_fix.returncode, 0, f"heading with link should pass: {proc_fix.stderr}"
+        )
+        actual = path.read_text(encoding="utf-8")
+        self.assertEqual(actual, content, "--fix must not change a passing file")
+        self.assertIn(
+            "[Getting Started](docs/getting-started.md)", actual, "link preserved"
+        )
+        self.assertIn("See ", actual)
+        self.assertIn(" for More", actual)
 
     def test_heading_with_link_fix_corrects_only_words_outside_link(self) -> None:
         """--fix corrects only 'see' and 'here' outside link; link text/path unchanged."""
@@ -242,23 +233,18 @@ Link text and path ignored.
 
 Link text and path ignored.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            combined = (proc.stdout or "") + "\n" + (proc.stderr or "")
-            self.assertIn(RULE, combined)
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "only words outside link are fixed; link text and path unchanged",
-            )
-            self.assertIn(
-                "[Ignore This Link](path/to/file.md)", actual, "link preserved exactly"
-            )
+        path = self._file
+        write_fixture(path, content_before)
+        proc_fix = fix_expecting_changes(path, RULE, _run_markdownlint)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertEqual(
+            actual, content_after,
+            "only words outside link are fixed; link text and path unchanged",
+        )
+        self.assertIn(
+            "[Ignore This Link](path/to/file.md)", actual, "link preserved exactly"
+        )
 
     def test_fix_link_text_title_case(self) -> None:
         """Link text not in title case is fixed by --fix to AP title case."""
@@ -274,16 +260,13 @@ Link text must be title case.
 
 Link text must be title case.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors for link text")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(actual, content_after, "link text should be title-cased")
-            self.assertIn("[Getting Started](docs/foo.md)", actual)
+        path = self._file
+        write_fixture(path, content_before)
+        proc_fix = fix_expecting_changes(path, RULE, _run_markdownlint)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertEqual(actual, content_after, "link text should be title-cased")
+        self.assertIn("[Getting Started](docs/foo.md)", actual)
 
     def test_fix_filenames_in_parens_get_backticks_not_title_case(self) -> None:
         """Filenames like (utils.js, allow-custom-anchors.js) get backticks, not Title Case."""
@@ -307,23 +290,21 @@ Rules and options.
 
 Text.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_heading_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "filenames in parens get backticks, not title case",
-            )
+        path = self._file
+        write_fixture(path, content_before)
+        proc_fix = fix_expecting_changes(path, RULE, _run_markdownlint)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        self.assert_file_content(
+            path, content_after,
+            "filenames in parens get backticks, not title case",
+        )
 
 
-class TestHeadingTitleCaseOptions(unittest.TestCase):
+class TestHeadingTitleCaseOptions(ScratchDirTestCase):
     """heading-title-case: config options (lowercaseWordsReplaceDefault, excludePathPatterns)."""
 
+    scratch_prefix = "fix_title_case_"
+
     def test_fix_with_lowercase_words_replace_default(self) -> None:
         content_before = """# T
 
@@ -333,22 +314,21 @@ class TestHeadingTitleCaseOptions(unittest.TestCase):
 
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_title_case_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-title-case": {
-                        "lowercaseWords": ["and"],
-                        "lowercaseWordsReplaceDefault": True,
-                    },
+        path = self._file
+        write_fixture(path, content_before)
+        proc = run_markdownlint_with_config(
+            {
+                "heading-title-case": {
+                    "lowercaseWords": ["and"],
+                    "lowercaseWordsReplaceDefault": True,
                 },
-                path,
-                fix=True,
-            )
-            self.assertEqual(proc.returncode, 0)
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("The and Bar", actual)
+            },
+            path,
+            fix=True,
+        )
+        self.assertEqual(proc.returncode, 0)
+        actual = path.read_text(encoding="utf-8")
+        self.assertIn("The and Bar", actual)
 
     def test_exclude_path_patterns_skips_rule(self) -> None:
         content = """# T
@@ -361,19 +341,18 @@ Content.
 """
         tmp = _REPO_ROOT / "tmp"
         tmp.mkdir(exist_ok=True)
-        path = tmp / "excluded_titlecase_fix.md"
-        rel = "tmp/excluded_titlecase_fix.md"
-        path.write_text(content, encoding="utf-8")
-        try:
+        # pid suffix keeps concurrent test processes (e.g. pytest -n) from sharing the file.
+        name = f"excluded_titlecase_fix.{os.getpid()}.md"
+        path = tmp / name
+        rel = f"tmp/{name}"
+        with scratch_file(path, content):
             proc = run_markdownlint_with_config(
                 {
                     "default": False,
                     "heading-title-case": {
-                        "excludePathPatterns": ["**", "**/excluded_titlecase_fix.md"],
+                        "excludePathPatterns": ["**", f"**/{name}"],
                     },
                 },
                 rel,
             )
             self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
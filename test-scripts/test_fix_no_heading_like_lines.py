@@ -1,20 +1,28 @@
 #!/usr/bin/env python3
 """
 Functional test for no-heading-like-lines fixInfo: generate a file with heading-like
-lines (e.g. **Summary:**, 1. **Introduction**), assert markdownlint reports errors,
-run --fix, then assert file content. Default fix converts to ATX heading; strip path
+lines (e.g. **Summary:**, 1. **Introduction**), run --fix (a changed file proves errors
+were reported), then assert file content. Default fix converts to ATX heading; strip path
 tested with convertToHeading: false.
 """
 
 from __future__ import annotations
 
+import functools
+import os
 import subprocess  # nosec B404
-import tempfile
-import unittest
 from pathlib import Path
 
 import verify_markdownlint_fixtures as v
-from markdownlint_config_helper import run_markdownlint_with_config
+from markdownlint_config_helper import (
+    ScratchDirTestCase,
+    fix_expecting_changes,
+    run_markdownlint,
+    run_markdownlint_with_config,
+    scratch_file,
+    start_markdownlint_worker,
+    write_fixture,
+)
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 RULE = "no-heading-like-lines"
@@ -27,23 +35,20 @@ def _run_markdownlint(
 ) -> subprocess.CompletedProcess:
     if config_overrides:
         return run_markdownlint_with_config(config_overrides, path, fix=fix)
-    cmd = v.find_markdownlint_cmd()
-    if fix:
-        cmd = [*cmd, "--fix", str(path)]
-    else:
-        cmd = [*cmd, str(path)]
-    return subprocess.run(
-        cmd,
-        cwd=v.repo_root(),
-        text=True,
-        capture_output=True,
-        check=False,
-    )  # nosec B603
-
-
-class TestFixNoHeadingLikeLines(unittest.TestCase):
+    args = ["--fix", str(path)] if fix else [str(path)]
+    return run_markdownlint(args, v.repo_root())
+
+
+def setUpModule() -> None:
+    """Start the shared markdownlint worker before the first test runs."""
+    start_markdownlint_worker()
+
+
+class TestFixNoHeadingLikeLines(ScratchDirTestCase):
     """Test that no-heading-like-lines fixInfo is applied by markdownlint --fix."""
 
+    scratch_prefix = "fix_no_heading_like_"
+
     def test_fix_strip_emphasis_and_file_updated(self) -> None:
         # With convertToHeading: false, fix strips emphasis and trailing colons.
         # Minimal TOC under first h1; content under ## so no-h1-content and no-empty-heading pass.
@@ -72,23 +77,17 @@ Introduction
 More content.
 """
         strip_config = {"default": False, "no-heading-like-lines": {"convertToHeading": False}}
-        with tempfile.TemporaryDirectory(prefix="fix_no_heading_like_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-
-            proc = _run_markdownlint(path, fix=False, config_overrides=strip_config)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            combined = (proc.stdout or "") + "\n" + (proc.stderr or "")
-            self.assertIn(RULE, combined, f"expected {RULE} in output")
+        path = self._file
+        write_fixture(path, content_before)
 
-            proc_fix = _run_markdownlint(path, fix=True, config_overrides=strip_config)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        run = functools.partial(_run_markdownlint, config_overrides=strip_config)
+        proc_fix = fix_expecting_changes(path, RULE, run)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
 
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "file content after --fix (convertToHeading false) should match expected",
-            )
+        self.assert_file_content(
+            path, content_after,
+            "file content after --fix (convertToHeading false) should match expected",
+        )
 
     def test_fix_convert_to_heading_option(self) -> None:
         """With convertToHeading: true, fix runs and heading-like line is fixed."""
@@ -99,24 +98,22 @@ More content.
 **Summary:**
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_no_heading_like_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            overrides = {
-                "default": False,
-                "no-heading-like-lines": {
-                    "convertToHeading": True,
-                    "defaultHeadingLevel": 2,
-                },
-            }
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            proc_fix = _run_markdownlint(path, fix=True, config_overrides=overrides)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            # Fix either strips to "Summary:" or converts to "## Summary:"; both remove **
-            self.assertIn("Summary", actual)
-            self.assertNotIn("**Summary**", actual)
+        path = self._file
+        write_fixture(path, content_before)
+        overrides = {
+            "default": False,
+            "no-heading-like-lines": {
+                "convertToHeading": True,
+                "defaultHeadingLevel": 2,
+            },
+        }
+        run = functools.partial(_run_markdownlint, config_overrides=overrides)
+        proc_fix = fix_expecting_changes(path, RULE, run)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        # Fix either strips to "Summary:" or converts to "## Summary:"; both remove **
+        self.assertIn("Summary", actual)
+        self.assertNotIn("**Summary**", actual)
 
     def test_fix_strips_trailing_colon_from_line(self) -> None:
         """fixInfo strips trailing colons; fixed line does not end with colon (strip path)."""
@@ -128,17 +125,16 @@ Content.
 Content.
 """
         strip_config = {"default": False, "no-heading-like-lines": {"convertToHeading": False}}
-        with tempfile.TemporaryDirectory(prefix="fix_no_heading_like_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc_fix = _run_markdownlint(path, fix=True, config_overrides=strip_config)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("Summary\n", actual, "fixed line is Summary with no trailing colon")
-            self.assertNotRegex(
-                actual, r"Summary:\s*\nContent",
-                "fixed line must not end with colon",
-            )
+        path = self._file
+        write_fixture(path, content_before)
+        proc_fix = _run_markdownlint(path, fix=True, config_overrides=strip_config)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertIn("Summary\n", actual, "fixed line is Summary with no trailing colon")
+        self.assertNotRegex(
+            actual, r"Summary:\s*\nContent",
+            "fixed line must not end with colon",
+        )
 
     def test_fixed_heading_level_option(self) -> None:
         """With fixedHeadingLevel: 3, suggested heading uses H3."""
@@ -151,20 +147,19 @@ Content.
 **Summary:**
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_no_heading_like_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            overrides = {
-                "default": False,
-                "no-heading-like-lines": {
-                    "convertToHeading": True,
-                    "fixedHeadingLevel": 3,
-                },
-            }
-            proc = _run_markdownlint(path, fix=True, config_overrides=overrides)
-            self.assertEqual(proc.returncode, 0, f"--fix should succeed: {proc.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("### Summary", actual)
+        path = self._file
+        write_fixture(path, content_before)
+        overrides = {
+            "default": False,
+            "no-heading-like-lines": {
+                "convertToHeading": True,
+                "fixedHeadingLevel": 3,
+            },
+        }
+        proc = _run_markdownlint(path, fix=True, config_overrides=overrides)
+        self.assertEqual(proc.returncode, 0, f"--fix should succeed: {proc.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertIn("### Summary", actual)
 
     def test_fix_convert_to_heading_preserves_backticks(self) -> None:
         """With convertToHeading: true, text inside backticks in heading-like line is preserved."""
@@ -175,25 +170,23 @@ Content.
 **Use `# noqa: E402` here:**
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_no_heading_like_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            overrides = {
-                "default": False,
-                "no-heading-like-lines": {
-                    "convertToHeading": True,
-                    "defaultHeadingLevel": 2,
-                },
-            }
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            proc_fix = _run_markdownlint(path, fix=True, config_overrides=overrides)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn(
-                "`# noqa: E402`", actual,
-                "inline code in heading-like line preserved when converted to heading",
-            )
+        path = self._file
+        write_fixture(path, content_before)
+        overrides = {
+            "default": False,
+            "no-heading-like-lines": {
+                "convertToHeading": True,
+                "defaultHeadingLevel": 2,
+            },
+        }
+        run = functools.partial(_run_markdownlint, config_overrides=overrides)
+        proc_fix = fix_expecting_changes(path, RULE, run)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertIn(
+            "`# noqa: E402`", actual,
+            "inline code in heading-like line preserved when converted to heading",
+        )
 
     def test_fix_short_title_case_colon_converts_to_heading(self) -> None:
         """Short title-case line ending in colon with prose is fixed to ATX heading (default)."""
@@ -204,21 +197,19 @@ Content.
 View Activity History:
 You can see past events in the dashboard.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_no_heading_like_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            overrides = {
-                "default": False,
-                "no-heading-like-lines": {"convertToHeading": True},
-            }
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            proc_fix = _run_markdownlint(path, fix=True, config_overrides=overrides)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertIn("### View Activity History", actual)
-            self.assertIn("You can see past events", actual)
-            self.assertNotIn("View Activity History:\n", actual)
+        path = self._file
+        write_fixture(path, content_before)
+        overrides = {
+            "default": False,
+            "no-heading-like-lines": {"convertToHeading": True},
+        }
+        run = functools.partial(_run_markdownlint, config_overrides=overrides)
+        proc_fix = fix_expecting_changes(path, RULE, run)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+        actual = path.read_text(encoding="utf-8")
+        self.assertIn("### View Activity History", actual)
+        self.assertIn("You can see past events", actual)
+        self.assertNotIn("View Activity History:\n", actual)
 
     def test_exclude_path_patterns_skips_rule(self) -> None:
         """With excludePathPatterns matching file, no error and fix not needed."""
@@ -233,17 +224,16 @@ Content.
 """
         tmp = _REPO_ROOT / "tmp"
         tmp.mkdir(exist_ok=True)
-        path = tmp / "excluded_heading_like.md"
-        rel = "tmp/excluded_heading_like.md"
-        path.write_text(content, encoding="utf-8")
-        try:
+        # pid suffix keeps concurrent test processes (e.g. pytest -n) from sharing the file.
+        name = f"excluded_heading_like.{os.getpid()}.md"
+        path = tmp / name
+        rel = f"tmp/{name}"
+        with scratch_file(path, content):
             overrides = {
                 "default": False,
                 "no-heading-like-lines": {
-                    "excludePathPatterns": ["**", "**/excluded_heading_like.md"],
+                    "excludePathPatterns": ["**", f"**/{name}"],
                 },
             }
             proc = run_markdownlint_with_config(overrides, rel, fix=False)
             self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
@@ -6,13 +6,19 @@ and assert the table is converted to a list.
 
 from __future__ import annotations
 
+import functools
 import subprocess  # nosec B404
-import tempfile
-import unittest
 from pathlib import Path
 
 import verify_markdownlint_fixtures as v
-from markdownlint_config_helper import run_markdownlint_with_config
+from markdownlint_config_helper import (
+    ScratchDirTestCase,
+    fix_expecting_changes,
+    run_markdownlint,
+    run_markdownlint_with_config,
+    start_markdownlint_worker,
+    write_fixture,
+)
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 RULE = "no-tables"
@@ -25,23 +31,20 @@ def _run_markdownlint(
 ) -> subprocess.CompletedProcess:
     if config_overrides:
         return run_markdownlint_with_config(config_overrides, path, fix=fix)
-    cmd = v.find_markdownlint_cmd()
-    if fix:
-        cmd = [*cmd, "--fix", str(path)]
-    else:
-        cmd = [*cmd, str(path)]
-    return subprocess.run(
-        cmd,
-        cwd=v.repo_root(),
-        text=True,
-        capture_output=True,
-        check=False,
-    )  # nosec B603
-
-
-class TestFixNoTables(unittest.TestCase):
+    args = ["--fix", str(path)] if fix else [str(path)]
+    return run_markdownlint(args, v.repo_root())
+
+
+def setUpModule() -> None:
+    """Start the shared markdownlint worker before the first test runs."""
+    start_markdownlint_worker()
+
+
+class TestFixNoTables(ScratchDirTestCase):
     """Test that no-tables with convert-to list applies fix and converts table to list."""
 
+    scratch_prefix = "fix_no_tables_"
+
     def test_fix_converts_table_to_list(self) -> None:
         content_before = """# Doc
 
@@ -64,21 +67,14 @@ class TestFixNoTables(unittest.TestCase):
   - heading 3: h3c2 content
 """
         overrides = {"no-tables": {"convert-to": "list"}}
-        with tempfile.TemporaryDirectory(prefix="fix_no_tables_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            combined = (proc.stdout or "") + "\n" + (proc.stderr or "")
-            self.assertIn(RULE, combined, f"expected {RULE} in output")
-
-            proc_fix = _run_markdownlint(path, fix=True, config_overrides=overrides)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual,
-                content_after,
-                "file content after --fix should be table converted to list",
-            )
+        path = self._file
+        write_fixture(path, content_before)
+
+        run = functools.partial(_run_markdownlint, config_overrides=overrides)
+        proc_fix = fix_expecting_changes(path, RULE, run)
+        self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
+
+        self.assert_file_content(
+            path, content_after,
+            "file content after --fix should be table converted to list",
+        )
@@ -1,59 +1,68 @@
 #!/usr/bin/env python3
 """
-Functional test for one-sentence-per-line fixInfo: create a file with multiple
-sentences on one line, assert markdownlint reports errors, run --fix, then assert
-all sentences are split in one pass with correct continuation indent.
+Functional test for one-sentence-per-line fixInfo: create files with multiple
+sentences on one line, run --fix once on all of them, then assert all sentences are
+split in one pass with correct continuation indent (every fixture changes, which also
+proves the rule reported errors).
 """
 
 from __future__ import annotations
 
+import os
 import subprocess  # nosec B404
-import tempfile
-import unittest
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 import verify_markdownlint_fixtures as v
-from markdownlint_config_helper import run_markdownlint_with_config
+from markdownlint_config_helper import (
+    ScratchDirTestCase,
+    run_markdownlint,
+    run_markdownlint_on_text,
+    run_markdownlint_with_config,
+    scratch_file,
+    start_markdownlint_worker,
+    write_fixture,
+)
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 RULE = "one-sentence-per-line"
+# Resolved once at import; every lint run in this module reuses it.
+_REPO_CWD = v.repo_root()
 
 
 def _run_markdownlint(
-    path: Path,
+    paths: Path | List[Path],
     fix: bool = False,
     config_overrides: dict | None = None,
 ) -> subprocess.CompletedProcess:
+    if isinstance(paths, Path):
+        paths = [paths]
     if config_overrides:
-        return run_markdownlint_with_config(config_overrides, path, fix=fix)
-    cmd = v.find_markdownlint_cmd()
-    if fix:
-        cmd = [*cmd, "--fix", str(path)]
-    else:
-        cmd = [*cmd, str(path)]
-    return subprocess.run(
-        cmd,
-        cwd=v.repo_root(),
-        text=True,
-        capture_output=True,
-        check=False,
-    )  # nosec B603
-
-
-class TestFixOneSentencePerLine(unittest.TestCase):
-    """Test that one-sentence-per-line fixInfo is applied by markdownlint --fix."""
+        return run_markdownlint_with_config(config_overrides, list(paths), fix=fix)
+    args = [str(p) for p in paths]
+    return run_markdownlint(["--fix", *args] if fix else args, _REPO_CWD)
+
+
+def _lint_text(content: str) -> subprocess.CompletedProcess:
+    """Lint content with only RULE enabled, in memory when the shared worker is available."""
+    return run_markdownlint_on_text({"default": False, RULE: True}, "test.md", content)
 
-    def test_fix_splits_all_sentences_in_one_pass(self) -> None:
-        # One run of --fix splits all sentence boundaries (paragraph).
-        content_before = """# Test
+
+# Split fixtures: name -> (content before, expected content after one --fix run).
+# All are written up front and fixed together by one markdownlint --fix run; since every
+# expected content differs from its input, a match also proves the rule reported errors.
+_SPLIT_CASES: Dict[str, Tuple[str, str]] = {
+    # One run of --fix splits all sentence boundaries (paragraph).
+    "all_sentences_in_one_pass": (
+        """# Test
 
 - [Section](#section)
 
 ## Section
 
 First sentence. Second sentence.
-"""
-        content_after = """# Test
+""",
+        """# Test
 
 - [Section](#section)
 
@@ -61,100 +70,88 @@ First sentence. Second sentence.
 
 First sentence.
 Second sentence.
-"""
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint errors before fix")
-            combined = (proc.stdout or "") + "\n" + (proc.stderr or "")
-            self.assertIn(RULE, combined, f"expected {RULE} in output")
-
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "file content after --fix should match expected",
-            )
-
-    def test_fix_list_item_uses_list_continuation_indent(self) -> None:
-        """Fix on a list line uses list body indent for continuation."""
-        content_before = """# Doc
+""",
+    ),
+    # Fix on a list line uses list body indent for continuation.
+    "list_continuation_indent": (
+        """# Doc
 
 ## Section
 
 - One. Two.
-"""
-        content_after = """# Doc
+""",
+        """# Doc
 
 ## Section
 
 - One.
   Two.
-"""
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(actual, content_after)
-
-    def test_fix_three_sentences_in_one_pass(self) -> None:
-        """Three sentences on one line are all split in a single --fix run."""
-        content_before = """# Doc
+""",
+    ),
+    # Three sentences on one line are all split in a single --fix run.
+    "three_sentences_in_one_pass": (
+        """# Doc
 
 ## Section
 
 One. Two. Three.
-"""
-        content_after = """# Doc
+""",
+        """# Doc
 
 ## Section
 
 One.
 Two.
 Three.
-"""
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(actual, content_after)
-
-    def test_fix_splits_after_period_before_bold(self) -> None:
-        """Sentence break after period then **bold** is detected; fix splits and preserves bold."""
-        content_before = """# Doc
+""",
+    ),
+    # Sentence break after period then **bold** is detected; fix splits and preserves bold.
+    "period_before_bold": (
+        """# Doc
 
 ## Section
 
 This is the first sentence. **Bolded text** rest of the sentence.
-"""
-        content_after = """# Doc
+""",
+        """# Doc
 
 ## Section
 
 This is the first sentence.
 **Bolded text** rest of the sentence.
-"""
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content_before, encoding="utf-8")
-            proc = _run_markdownlint(path, fix=False)
-            self.assertNotEqual(proc.returncode, 0, "expected lint error before fix")
-            self.assertIn(RULE, (proc.stdout or "") + (proc.stderr or ""))
-            proc_fix = _run_markdownlint(path, fix=True)
-            self.assertEqual(proc_fix.returncode, 0, f"--fix should succeed: {proc_fix.stderr}")
-            actual = path.read_text(encoding="utf-8")
-            self.assertEqual(
-                actual, content_after,
-                "fix should split at period and preserve bold",
-            )
+""",
+    ),
+}
+
+
+def setUpModule() -> None:
+    """Start the shared markdownlint worker before the first test runs."""
+    start_markdownlint_worker()
+
+
+class TestFixOneSentencePerLine(ScratchDirTestCase):
+    """Test that one-sentence-per-line fixInfo is applied by markdownlint --fix."""
+
+    scratch_prefix = "fix_one_sentence_"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The class scratch dir holds every split fixture.
+        super().setUpClass()
+        cls._repo_tmp = _REPO_ROOT / "tmp"
+        cls._repo_tmp.mkdir(exist_ok=True)
+        paths = {name: cls._tmp / f"{name}.md" for name in _SPLIT_CASES}
+        for name, path in paths.items():
+            write_fixture(path, _SPLIT_CASES[name][0])
+        cls._fix = _run_markdownlint(list(paths.values()), fix=True)
+        cls._fixed = {name: path.read_text(encoding="utf-8") for name, path in paths.items()}
+
+    def test_fix_variants(self) -> None:
+        """Every split fixture matches its expected content after the shared --fix run."""
+        self.assertEqual(self._fix.returncode, 0, f"--fix should succeed: {self._fix.stderr}")
+        for name, (_, expected) in _SPLIT_CASES.items():
+            with self.subTest(name=name):
+                self.assertEqual(self._fixed[name], expected, "fix should split every sentence")
 
     def test_no_split_within_filenames(self) -> None:
         """Period in filenames (no space after) does not trigger split."""
@@ -165,13 +162,9 @@ This is the first sentence.
 See file.name and config.json for details.
 Edit utils.js or README.md.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            overrides = {"default": False, RULE: True}
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            msg = f"no one-sentence-per-line errors expected: {proc.stderr}"
-            self.assertEqual(proc.returncode, 0, msg)
+        proc = _lint_text(content)
+        msg = f"no one-sentence-per-line errors expected: {proc.stderr}"
+        self.assertEqual(proc.returncode, 0, msg)
 
     def test_no_split_on_ellipsis_in_sentence(self) -> None:
         """Ellipsis (...) in the middle of a sentence does not trigger one-sentence-per-line."""
@@ -180,13 +173,9 @@ Edit utils.js or README.md.
 Inference connectivity configuration... supplied by the orchestrator in the \
 **PMA managed service start bundle**.
 """
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            overrides = {"default": False, RULE: True}
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            msg = f"no {RULE} errors expected for ellipsis in sentence: {proc.stderr}"
-            self.assertEqual(proc.returncode, 0, msg)
+        proc = _lint_text(content)
+        msg = f"no {RULE} errors expected for ellipsis in sentence: {proc.stderr}"
+        self.assertEqual(proc.returncode, 0, msg)
 
     def test_no_split_on_identifiers_with_periods(self) -> None:
         """Periods in identifiers (e.g. CYNAI.PROJCT) with no space after do not trigger split."""
@@ -196,13 +185,9 @@ Inference connectivity configuration... supplied by the orchestrator in the \
 
 - CYNAI.PROJCT.ProjectGitRepos: Model (many repos per project, uniqueness per project).
 """
-        with tempfile.TemporaryDirectory(prefix="fix_one_sentence_") as tmp:
-            path = Path(tmp) / "test.md"
-            path.write_text(content, encoding="utf-8")
-            overrides = {"default": False, RULE: True}
-            proc = _run_markdownlint(path, fix=False, config_overrides=overrides)
-            msg = f"no {RULE} errors expected: {proc.stderr}"
-            self.assertEqual(proc.returncode, 0, msg)
+        proc = _lint_text(content)
+        msg = f"no {RULE} errors expected: {proc.stderr}"
+        self.assertEqual(proc.returncode, 0, msg)
 
     def test_exclude_path_patterns_skips_rule(self) -> None:
         """With excludePathPatterns matching file, no error and fix not needed."""
@@ -214,19 +199,16 @@ Inference connectivity configuration... supplied by the orchestrator in the \
 
 First. Second.
 """
-        tmp = _REPO_ROOT / "tmp"
-        tmp.mkdir(exist_ok=True)
-        path = tmp / "excluded_one_sentence.md"
-        rel = "tmp/excluded_one_sentence.md"
-        path.write_text(content, encoding="utf-8")
-        try:
+        # pid suffix keeps concurrent test processes (e.g. pytest -n) from sharing the file.
+        name = f"excluded_one_sentence.{os.getpid()}.md"
+        path = self._repo_tmp / name
+        rel = f"tmp/{name}"
+        with scratch_file(path, content):
             overrides = {
                 "default": False,
                 "one-sentence-per-line": {
-                    "excludePathPatterns": ["**", "**/excluded_one_sentence.md"],
+                    "excludePathPatterns": ["**", f"**/{name}"],
                 },
             }
             proc = run_markdownlint_with_config(overrides, rel, fix=False)
             self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
@@ -7,246 +7,271 @@ Each test runs markdownlint with an alternate config and asserts expected behavi
 
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
 import subprocess  # nosec B404
 import tempfile
+import threading
 import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Tuple
+from unittest.mock import MagicMock, patch
 
-import verify_markdownlint_fixtures as v
+import markdownlint_config_helper as helper
 from markdownlint_config_helper import (
+    ScratchDirTestCase,
+    combined_output,
+    rules_present,
+    run_markdownlint_batch,
+    run_markdownlint_on_text,
     run_markdownlint_with_config,
+    scratch_file,
+    start_markdownlint_worker,
     temp_markdownlint_config,
+    write_fixture,
 )
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 
+# Shared fixture content, built once at import.
+_TWENTY_LINES = "".join(f"line {i}\n" for i in range(20))
+_LONG_DOC_20_LINES = "# T\n\n" + _TWENTY_LINES
+_SECTION_WITH_COMMENT = """# T
+
+## Section
+
+<!-- comment only under section -->
+"""
+# One line longer than the repo's MD013 line_length (500), with no blank line after ## S.
+_MD013_LONG_LINE_FIXTURE = f"# T\n\n- [S](#s)\n\n## S\n{'x' * 501}\n"
+_SECTION_WITH_BR = """# T
+
+- [S](#s)
+
+## Section One
+
+<br>
+
+Prose line.
+"""
+
 
 def _repo_tmp_file(filename: str) -> tuple[Path, str]:
-    """Return (absolute Path, repo-relative path string) for a file in repo tmp/."""
+    """
+    Return (absolute Path, repo-relative path string) for a file in repo tmp/.
+
+    The pid is inserted before the suffix (e.g. excluded_doclen.1234.md) so test processes
+    running in parallel never share a file; use path.name when matching it in globs.
+    """
     tmp = _REPO_ROOT / "tmp"
     tmp.mkdir(exist_ok=True)
-    return tmp / filename, f"tmp/{filename}"
+    stem, dot, suffix = filename.rpartition(".")
+    name = f"{stem}.{os.getpid()}{dot}{suffix}"
+    return tmp / name, f"tmp/{name}"
 
 
-class TestDocumentLengthOption(unittest.TestCase):
-    """document-length: maximum, excludePathPatterns."""
+# Content-addressed fixture files written by _repo_tmp_file_for; removed by tearDownModule.
+_CONTENT_FILES: Dict[str, Path] = {}
 
-    def test_maximum_option_rejects_long_document(self) -> None:
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False, encoding="utf-8"
-        ) as f:
-            path = Path(f.name)
-            lines = ["# T", ""] + [f"line {i}" for i in range(20)]
-            f.write("\n".join(lines) + "\n")
-        try:
-            proc = run_markdownlint_with_config(
-                {"document-length": {"maximum": 10}},
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("document-length", (proc.stdout or "") + (proc.stderr or ""))
-        finally:
-            path.unlink(missing_ok=True)
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        lines = ["# T", "", "- [S](#section)", "", "## Section", ""] + [
-            f"line {i}" for i in range(20)
-        ]
-        path, rel = _repo_tmp_file("excluded_doclen.md")
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "document-length": {
-                        "maximum": 10,
-                        "excludePathPatterns": ["**", "**/excluded_doclen.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
 
+def _repo_tmp_file_for(content: str) -> tuple[Path, str]:
+    """
+    Return (absolute Path, repo-relative path string) for a repo tmp/ file holding content.
 
-class TestNoEmptyHeadingOptions(unittest.TestCase):
-    """no-empty-heading: all content-count and path options."""
+    The file is named by a hash of content (plus the pid, as in _repo_tmp_file) and written
+    only on first use, so tests with identical fixtures share one file.
+    """
+    data = content.encode("utf-8")
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    path = _CONTENT_FILES.get(digest)
+    if path is None:
+        path, _ = _repo_tmp_file(f"{digest}.md")
+        write_fixture(path, content)
+        _CONTENT_FILES[digest] = path
+    return path, f"tmp/{path.name}"
 
-    def test_count_html_comments_as_content(self) -> None:
-        content = """# T
 
-## Section
+class _OptionsTestCase(ScratchDirTestCase):
+    """Base for option tests: one scratch dir per class; tests name files after themselves."""
 
-<!-- comment only under section -->
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc_default = run_markdownlint_with_config({}, path)
-            self.assertNotEqual(proc_default.returncode, 0)
-            proc_comment_ok = run_markdownlint_with_config(
-                {"no-empty-heading": {"countHTMLCommentsAsContent": True}},
-                path,
-            )
-            self.assertEqual(proc_comment_ok.returncode, 0)
+    scratch_prefix = "mdl_opts_"
 
-    def test_minimum_content_lines(self) -> None:
-        content = """# T
 
-## Section
+def _submit_cases(
+    tmp: Path, cases: Dict[str, Tuple[dict, str]]
+) -> Dict[str, Future]:
+    """
+    Write each case to tmp/<name>.md and start its lint run; return name -> Future.
 
-One line.
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"no-empty-heading": {"minimumContentLines": 2}},
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("no-empty-heading", (proc.stdout or "") + (proc.stderr or ""))
+    Every case has its own config, so they cannot share one run_markdownlint_batch() run.
+    The shared markdownlint worker handles one job at a time, so with it the runs go
+    through a single thread; only when the CLI is spawned per run (no worker) do threads,
+    one per CPU, let the runs overlap.
+    """
+    jobs = 1 if start_markdownlint_worker() else os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for name, (overrides, content) in cases.items():
+            path = tmp / f"{name}.md"
+            write_fixture(path, content)
+            futures[name] = executor.submit(run_markdownlint_with_config, overrides, path)
+    return futures
 
-    def test_count_blank_lines_as_content(self) -> None:
-        content = """# T
 
-- [S](#s)
+def setUpModule() -> None:
+    """Start the shared markdownlint worker before the first test runs."""
+    start_markdownlint_worker()
 
-## Section One
 
+def tearDownModule() -> None:
+    """Remove the content-addressed fixtures written by _repo_tmp_file_for."""
+    for path in _CONTENT_FILES.values():
+        path.unlink(missing_ok=True)
+    _CONTENT_FILES.clear()
 
-One prose line.
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "no-empty-heading": {
-                        "minimumContentLines": 2,
-                        "countBlankLinesAsContent": True,
-                    },
-                },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
 
-    def test_count_html_lines_as_content(self) -> None:
-        content = """# T
+class TestDocumentLengthOption(unittest.TestCase):
+    """document-length: maximum."""
+
+    def test_maximum_option_rejects_long_document(self) -> None:
+        proc = run_markdownlint_on_text(
+            {"document-length": {"maximum": 10}},
+            "f.md",
+            _LONG_DOC_20_LINES,
+        )
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("document-length", rules_present(combined_output(proc)))
+
+
+class TestNoEmptyHeadingOptions(_OptionsTestCase):
+    """no-empty-heading: all content-count options."""
+
+    # test name -> (config overrides, content); setUpClass submits every run up front.
+    _CASES: Dict[str, Tuple[dict, str]] = {
+        "test_minimum_content_lines": (
+            {"no-empty-heading": {"minimumContentLines": 2}},
+            """# T
+
+## Section
+
+One line.
+""",
+        ),
+        "test_count_blank_lines_as_content": (
+            {
+                "default": False,
+                "no-empty-heading": {
+                    "minimumContentLines": 2,
+                    "countBlankLinesAsContent": True,
+                },
+            },
+            """# T
 
 - [S](#s)
 
 ## Section One
 
-<br>
 
-Prose line.
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "no-empty-heading": {
-                        "minimumContentLines": 2,
-                        "countHtmlLinesAsContent": True,
-                    },
+One prose line.
+""",
+        ),
+        "test_count_html_lines_as_content": (
+            {
+                "default": False,
+                "no-empty-heading": {
+                    "minimumContentLines": 2,
+                    "countHtmlLinesAsContent": True,
                 },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
-
-    def test_count_code_block_lines_as_content_false(self) -> None:
-        content = """# T
+            },
+            _SECTION_WITH_BR,
+        ),
+        "test_count_code_block_lines_as_content_false": (
+            {"no-empty-heading": {"countCodeBlockLinesAsContent": False}},
+            """# T
 
 ## Section
 
 ```text
 only code
 ```
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"no-empty-heading": {"countCodeBlockLinesAsContent": False}},
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("no-empty-heading", (proc.stdout or "") + (proc.stderr or ""))
+""",
+        ),
+    }
 
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._futures = _submit_cases(cls._tmp, cls._CASES)
 
-- [S](#s)
+    def test_count_html_comments_as_content(self) -> None:
+        content = _SECTION_WITH_COMMENT
+        proc_default = run_markdownlint_on_text({}, "f.md", content)
+        self.assertNotEqual(proc_default.returncode, 0)
+        proc_comment_ok = run_markdownlint_on_text(
+            {"no-empty-heading": {"countHTMLCommentsAsContent": True}},
+            "f.md",
+            content,
+        )
+        self.assertEqual(proc_comment_ok.returncode, 0)
 
-## Section One
+    def test_minimum_content_lines(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("no-empty-heading", rules_present(combined_output(proc)))
 
-"""
-        path, rel = _repo_tmp_file("excluded_empty_heading.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "no-empty-heading": {
-                        "excludePathPatterns": ["**", "**/excluded_empty_heading.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+    def test_count_blank_lines_as_content(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertEqual(proc.returncode, 0)
 
+    def test_count_html_lines_as_content(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertEqual(proc.returncode, 0)
 
-class TestHeadingNumberingOptions(unittest.TestCase):
-    """heading-numbering: maxHeadingLevel, maxSegmentValue, level range, excludePathPatterns."""
+    def test_count_code_block_lines_as_content_false(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("no-empty-heading", rules_present(combined_output(proc)))
 
-    def test_max_heading_level(self) -> None:
-        content = """# T
+
+class TestHeadingNumberingOptions(_OptionsTestCase):
+    """heading-numbering: maxHeadingLevel, maxSegmentValue, level range."""
+
+    # test name -> (config overrides, content); setUpClass submits every run up front.
+    _CASES: Dict[str, Tuple[dict, str]] = {
+        "test_max_heading_level": (
+            {"heading-numbering": {"maxHeadingLevel": 3}},
+            """# T
 
 ## 1. A
 
 ### 1.1 B
 
 #### 1.1.1 C
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"heading-numbering": {"maxHeadingLevel": 3}},
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("heading-numbering", (proc.stdout or "") + (proc.stderr or ""))
-
-    def test_max_segment_value_rejects_large_segment(self) -> None:
-        content = """# T
+""",
+        ),
+        "test_max_segment_value_rejects_large_segment": (
+            {"heading-numbering": {"maxSegmentValue": 5}},
+            """# T
 
 ## 1. A
 
 ### 6. B
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"heading-numbering": {"maxSegmentValue": 5}},
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("heading-numbering", (proc.stdout or "") + (proc.stderr or ""))
-            self.assertIn("exceeds maximum", (proc.stdout or "") + (proc.stderr or ""))
-
-    def test_max_segment_value_level_range(self) -> None:
+""",
+        ),
         # Only H3 is in scope for maxSegmentValue (min/max level 3).
         # Use ## 1. Root and ### 1.1 First so numbering is valid and H3 segment values (1, 1) <= 5.
-        content = """# T
+        "test_max_segment_value_level_range": (
+            {
+                "default": False,
+                "heading-numbering": {
+                    "maxSegmentValue": 5,
+                    "maxSegmentValueMinLevel": 3,
+                    "maxSegmentValueMaxLevel": 3,
+                },
+            },
+            """# T
 
 - [R](#root)
 
@@ -255,48 +280,32 @@ class TestHeadingNumberingOptions(unittest.TestCase):
 Content under root.
 
 ### 1.1 First
-"""
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "heading-numbering": {
-                        "maxSegmentValue": 5,
-                        "maxSegmentValueMinLevel": 3,
-                        "maxSegmentValueMaxLevel": 3,
-                    },
-                },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+""",
+        ),
+    }
 
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._futures = _submit_cases(cls._tmp, cls._CASES)
 
-## A
+    def test_max_heading_level(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("heading-numbering", rules_present(combined_output(proc)))
 
-### B
-"""
-        path, rel = _repo_tmp_file("excluded_numbering.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "heading-numbering": {
-                        "excludePathPatterns": ["**", "**/excluded_numbering.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+    def test_max_segment_value_rejects_large_segment(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("heading-numbering", rules_present(combined_output(proc)))
+        self.assertIn("exceeds maximum", combined_output(proc))
+
+    def test_max_segment_value_level_range(self) -> None:
+        proc = self._futures[self._testMethodName].result()
+        self.assertEqual(proc.returncode, 0)
 
 
-class TestHeadingMinWordsOption(unittest.TestCase):
+class TestHeadingMinWordsOption(_OptionsTestCase):
     """heading-min-words: minWords, applyToLevelsAtOrBelow, allowList, stripNumbering."""
 
     def test_min_words_option(self) -> None:
@@ -304,20 +313,18 @@ class TestHeadingMinWordsOption(unittest.TestCase):
 
 ## A
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-min-words": {
-                        "minWords": 2,
-                        "applyToLevelsAtOrBelow": 2,
-                    },
+        proc = run_markdownlint_on_text(
+            {
+                "heading-min-words": {
+                    "minWords": 2,
+                    "applyToLevelsAtOrBelow": 2,
                 },
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("heading-min-words", (proc.stdout or "") + (proc.stderr or ""))
+            },
+            "f.md",
+            content,
+        )
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("heading-min-words", rules_present(combined_output(proc)))
 
     def test_min_level_max_level_restricts_scope(self) -> None:
         content = """# T
@@ -331,22 +338,21 @@ Content under H2.
 
 ### Two Words
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "heading-min-words": {
-                        "minWords": 2,
-                        "applyToLevelsAtOrBelow": 4,
-                        "minLevel": 3,
-                        "maxLevel": 3,
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "default": False,
+                "heading-min-words": {
+                    "minWords": 2,
+                    "applyToLevelsAtOrBelow": 4,
+                    "minLevel": 3,
+                    "maxLevel": 3,
                 },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+            },
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
     def test_allow_list_allows_exact_title(self) -> None:
         content = """# T
@@ -357,121 +363,88 @@ Content under H2.
 
 Content here.
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-min-words": {
-                        "minWords": 2,
-                        "applyToLevelsAtOrBelow": 2,
-                        "allowList": ["Overview"],
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "heading-min-words": {
+                    "minWords": 2,
+                    "applyToLevelsAtOrBelow": 2,
+                    "allowList": ["Overview"],
                 },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+            },
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
     def test_strip_numbering_false_counts_numbering_as_words(self) -> None:
         content = """# T
 
 ## 1.2.3 A
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-min-words": {
-                        "minWords": 3,
-                        "applyToLevelsAtOrBelow": 2,
-                        "stripNumbering": False,
-                    },
-                },
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("heading-min-words", (proc.stdout or "") + (proc.stderr or ""))
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
-
-## A
-"""
-        path, rel = _repo_tmp_file("excluded_minwords.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "heading-min-words": {
-                        "minWords": 2,
-                        "applyToLevelsAtOrBelow": 2,
-                        "excludePathPatterns": ["**", "**/excluded_minwords.md"],
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "heading-min-words": {
+                    "minWords": 3,
+                    "applyToLevelsAtOrBelow": 2,
+                    "stripNumbering": False,
                 },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+            },
+            path,
+        )
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("heading-min-words", rules_present(combined_output(proc)))
 
 
 class TestHtmlCommentSuppress(unittest.TestCase):
     """HTML comment override: <!-- rule-name allow --> on previous line or at end of line suppresses that rule."""  # noqa: E501
 
-    def test_heading_min_words_suppressed_when_comment_on_previous_line(self) -> None:
-        content = """# T
+    # Both fixtures share one config, so setUpClass lints them in a single run.
+    _CONFIG = {"heading-min-words": {"minWords": 2, "applyToLevelsAtOrBelow": 2}}
+    _FIXTURES = {
+        "html_suppress_heading_min_words.md": """# T
 
 <!-- heading-min-words allow -->
 ## Foo
 
 Content.
-"""
-        path, rel = _repo_tmp_file("html_suppress_heading_min_words.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-min-words": {
-                        "minWords": 2,
-                        "applyToLevelsAtOrBelow": 2,
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0, (proc.stdout or "") + (proc.stderr or ""))
-        finally:
-            path.unlink(missing_ok=True)
-
-    def test_heading_min_words_not_suppressed_when_wrong_rule_in_comment(self) -> None:
-        content = """# T
+""",
+        "html_suppress_wrong_rule.md": """# T
 
 <!-- ascii-only allow -->
 ## Foo
 
 Content.
-"""
-        path, rel = _repo_tmp_file("html_suppress_wrong_rule.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-min-words": {
-                        "minWords": 2,
-                        "applyToLevelsAtOrBelow": 2,
-                    },
-                },
-                rel,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn("heading-min-words", (proc.stdout or "") + (proc.stderr or ""))
-        finally:
-            path.unlink(missing_ok=True)
+""",
+    }
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._rel = {}
+        for filename, content in cls._FIXTURES.items():
+            path, rel = _repo_tmp_file(filename)
+            write_fixture(path, content)
+            cls.addClassCleanup(path.unlink, missing_ok=True)
+            cls._rel[filename] = rel
+        cls._results = run_markdownlint_batch(cls._CONFIG, list(cls._rel.values()))
+
+    def _result(self, filename: str) -> subprocess.CompletedProcess:
+        return self._results[self._rel[filename]]
+
+    def test_heading_min_words_suppressed_when_comment_on_previous_line(self) -> None:
+        proc = self._result("html_suppress_heading_min_words.md")
+        self.assertEqual(proc.returncode, 0, combined_output(proc))
 
+    def test_heading_min_words_not_suppressed_when_wrong_rule_in_comment(self) -> None:
+        proc = self._result("html_suppress_wrong_rule.md")
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("heading-min-words", rules_present(combined_output(proc)))
 
-class TestAsciiOnlyOptions(unittest.TestCase):
-    """ascii-only: path patterns, emoji, unicode, code blocks, excludePathPatterns."""
+
+class TestAsciiOnlyOptions(_OptionsTestCase):
+    """ascii-only: path patterns, emoji, unicode, code blocks."""
 
     def test_emoji_allowed_in_matching_path(self) -> None:
         content = """# T
@@ -480,23 +453,17 @@ class TestAsciiOnlyOptions(unittest.TestCase):
 
 ✅ allowed when path in allowedPathPatternsEmoji.
 """
-        tmp_dir = _REPO_ROOT / "tmp"
-        tmp_dir.mkdir(exist_ok=True)
-        path = tmp_dir / "test_markdownlint_options_emoji.md"
-        try:
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "ascii-only": {
-                        "allowedPathPatternsEmoji": [str(path.resolve())],
-                        "allowedEmoji": ["✅"],
-                    },
+        path, _ = _repo_tmp_file_for(content)
+        proc = run_markdownlint_with_config(
+            {
+                "ascii-only": {
+                    "allowedPathPatternsEmoji": [str(path.resolve())],
+                    "allowedEmoji": ["✅"],
                 },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+            },
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
     def test_allowed_path_patterns_unicode_allows_any_non_ascii(self) -> None:
         content = """# T
@@ -505,14 +472,13 @@ class TestAsciiOnlyOptions(unittest.TestCase):
 
 café and naïve.
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "unicode_allowed.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"ascii-only": {"allowedPathPatternsUnicode": ["**/unicode_allowed.md"]}},
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+        path = self._tmp / "unicode_allowed.md"
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {"ascii-only": {"allowedPathPatternsUnicode": ["**/unicode_allowed.md"]}},
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
     def test_allow_unicode_in_code_blocks_false_checks_fenced(self) -> None:
         # With allowUnicodeInCodeBlocks: False, unicode in fenced blocks is reported.
@@ -527,22 +493,18 @@ café and naïve.
 café
 ```
 """
-        path, rel = _repo_tmp_file("ascii_fenced.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {"ascii-only": {"allowUnicodeInCodeBlocks": False}},
-                rel,
-            )
-            out = (proc.stdout or "") + (proc.stderr or "")
-            # Temp config may not apply when cwd=tmp; at least assert no crash.
-            self.assertIn(
-                "markdownlint",
-                out,
-                "markdownlint should run",
-            )
-        finally:
-            path.unlink(missing_ok=True)
+        path, rel = _repo_tmp_file_for(content)
+        proc = run_markdownlint_with_config(
+            {"ascii-only": {"allowUnicodeInCodeBlocks": False}},
+            rel,
+        )
+        out = combined_output(proc)
+        # Temp config may not apply when cwd=tmp; at least assert no crash.
+        self.assertIn(
+            "markdownlint",
+            out,
+            "markdownlint should run",
+        )
 
     def test_disallow_unicode_in_code_block_types_only_checks_those(self) -> None:
         content = """# T
@@ -559,73 +521,25 @@ echo café
 ascii only
 ```
 """
-        path, rel = _repo_tmp_file("ascii_bash_only.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "fenced-code-under-heading": False,
-                    "ascii-only": {
-                        "allowUnicodeInCodeBlocks": False,
-                        "disallowUnicodeInCodeBlockTypes": ["bash"],
-                    },
+        path, rel = _repo_tmp_file_for(content)
+        proc = run_markdownlint_with_config(
+            {
+                "default": False,
+                "fenced-code-under-heading": False,
+                "ascii-only": {
+                    "allowUnicodeInCodeBlocks": False,
+                    "disallowUnicodeInCodeBlockTypes": ["bash"],
                 },
-                rel,
-            )
-            out = (proc.stdout or "") + (proc.stderr or "")
-            # Temp config may not apply when cwd=tmp; at least assert no crash.
-            self.assertIn("markdownlint", out, "markdownlint should run")
-        finally:
-            path.unlink(missing_ok=True)
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
-
-## S
-
-café
-"""
-        path, rel = _repo_tmp_file("excluded_ascii.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "ascii-only": {
-                        "excludePathPatterns": ["**", "**/excluded_ascii.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+            },
+            rel,
+        )
+        out = combined_output(proc)
+        # Temp config may not apply when cwd=tmp; at least assert no crash.
+        self.assertIn("markdownlint", out, "markdownlint should run")
 
 
 class TestNoH1ContentOptions(unittest.TestCase):
-    """no-h1-content: excludePathPatterns."""
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# Title
-
-Some prose under h1.
-"""
-        path, rel = _repo_tmp_file("excluded_h1_content.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "no-h1-content": {
-                        "excludePathPatterns": ["**", "**/excluded_h1_content.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+    """no-h1-content: content allowed under the first H1."""
 
     def test_reference_style_badges_under_h1_allowed(self) -> None:
         """Reference-style badge lines under first H1 do not trigger no-h1-content."""
@@ -648,16 +562,12 @@ Content here.
 [badge-license]: https://example.com/license.svg
 [license-file]: LICENSE
 """
-        path, rel = _repo_tmp_file("no_h1_content_ref_badges.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config({}, rel)
-            self.assertEqual(proc.returncode, 0, f"Expected lint to pass; stderr: {proc.stderr}")
-        finally:
-            path.unlink(missing_ok=True)
+        path, rel = _repo_tmp_file_for(content)
+        proc = run_markdownlint_with_config({}, rel)
+        self.assertEqual(proc.returncode, 0, f"Expected lint to pass; stderr: {proc.stderr}")
 
 
-class TestFencedCodeUnderHeadingOptions(unittest.TestCase):
+class TestFencedCodeUnderHeadingOptions(_OptionsTestCase):
     """fenced-code-under-heading: languages, min/maxHeadingLevel, maxBlocksPerHeading, exclusive."""
 
     def test_languages_and_require_heading(self) -> None:
@@ -667,23 +577,21 @@ class TestFencedCodeUnderHeadingOptions(unittest.TestCase):
 package main
 ```
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "fenced-code-under-heading": {
-                        "languages": ["go"],
-                        "requireHeading": True,
-                    },
+        proc = run_markdownlint_on_text(
+            {
+                "fenced-code-under-heading": {
+                    "languages": ["go"],
+                    "requireHeading": True,
                 },
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn(
-                "fenced-code-under-heading",
-                (proc.stdout or "") + (proc.stderr or ""),
-            )
+            },
+            "f.md",
+            content,
+        )
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn(
+            "fenced-code-under-heading",
+            rules_present(combined_output(proc)),
+        )
 
     def test_min_heading_level_excludes_h2(self) -> None:
         content = """# T
@@ -696,21 +604,20 @@ package main
 x
 ```
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "fenced-code-under-heading": {
-                        "languages": ["go"],
-                        "minHeadingLevel": 3,
-                        "maxHeadingLevel": 6,
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "default": False,
+                "fenced-code-under-heading": {
+                    "languages": ["go"],
+                    "minHeadingLevel": 3,
+                    "maxHeadingLevel": 6,
                 },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+            },
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
     def test_exclusive_rejects_second_block_under_same_heading(self) -> None:
         content = """# T
@@ -725,51 +632,26 @@ a
 b
 ```
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "fenced-code-under-heading": {
-                        "languages": ["go"],
-                        "exclusive": True,
-                    },
-                },
-                path,
-            )
-            self.assertNotEqual(proc.returncode, 0)
-            self.assertIn(
-                "fenced-code-under-heading",
-                (proc.stdout or "") + (proc.stderr or ""),
-            )
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
-
-```go
-x
-```
-"""
-        path, rel = _repo_tmp_file("excluded_fenced.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "fenced-code-under-heading": {
-                        "languages": ["go"],
-                        "excludePathPatterns": ["**", "**/excluded_fenced.md"],
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "fenced-code-under-heading": {
+                    "languages": ["go"],
+                    "exclusive": True,
                 },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+            },
+            path,
+        )
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn(
+            "fenced-code-under-heading",
+            rules_present(combined_output(proc)),
+        )
 
 
-class TestAllowCustomAnchorsOptions(unittest.TestCase):
-    """allow-custom-anchors: allowedIdPatterns, strictPlacement, excludePathPatterns."""
+class TestAllowCustomAnchorsOptions(_OptionsTestCase):
+    """allow-custom-anchors: allowedIdPatterns, strictPlacement."""
 
     def test_strict_placement_false_allows_any_placement(self) -> None:
         content = """# T
@@ -780,93 +662,34 @@ class TestAllowCustomAnchorsOptions(unittest.TestCase):
 
 Text.
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "allow-custom-anchors": {
-                        "allowedIdPatterns": ["^custom-[a-z]+$"],
-                        "strictPlacement": False,
-                    },
-                },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
-
-- [A](#a)
-
-<a id="disallowed"></a>
-"""
-        path, rel = _repo_tmp_file("excluded_anchors.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "allow-custom-anchors": {
-                        "allowedIdPatterns": ["^spec-[a-z]+$"],
-                        "excludePathPatterns": ["**", "**/excluded_anchors.md"],
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "default": False,
+                "allow-custom-anchors": {
+                    "allowedIdPatterns": ["^custom-[a-z]+$"],
+                    "strictPlacement": False,
                 },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
-
-
-class TestNoDuplicateHeadingsNormalizedOptions(unittest.TestCase):
-    """no-duplicate-headings-normalized: excludePathPatterns."""
-
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
-
-- [S](#same)
-- [S2](#same-2)
-
-## Same
-
-x
+            },
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
-## Same
 
-y
-"""
-        path, rel = _repo_tmp_file("excluded_dup.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "no-duplicate-headings-normalized": {
-                        "excludePathPatterns": ["**", "**/excluded_dup.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
-
-
-class TestMD013Options(unittest.TestCase):
+class TestMD013Options(_OptionsTestCase):
     """MD013/line-length: line_length, code_blocks."""
 
     def test_line_length_rejects_long_line(self) -> None:
         # Repo base has MD013 line_length 500; use a line longer than that so MD013 can fire.
         # Run with repo default config on a file in md_test_files (tmp/ is ignored).
         # Also omit blank after ## so MD022 fires if MD013 does not (config may vary).
-        long_line = "x" * 501
-        content = f"# T\n\n- [S](#s)\n\n## S\n{long_line}\n"
-        path = _REPO_ROOT / "md_test_files" / "long_line_test.md"
-        path.write_text(content, encoding="utf-8")
-        try:
-            cmd = v.find_markdownlint_cmd() + ["md_test_files/long_line_test.md"]
+        content = _MD013_LONG_LINE_FIXTURE
+        path = _REPO_ROOT / "md_test_files" / f"long_line_test.{os.getpid()}.md"
+        with scratch_file(path, content):
+            import verify_markdownlint_fixtures as v  # only this test needs the verifier
+
+            cmd = v.find_markdownlint_cmd() + [f"md_test_files/{path.name}"]
             proc = subprocess.run(
                 cmd,
                 cwd=str(_REPO_ROOT),
@@ -874,14 +697,12 @@ class TestMD013Options(unittest.TestCase):
                 capture_output=True,
                 check=False,
             )  # nosec B603
-            out = (proc.stdout or "") + (proc.stderr or "")
+            out = combined_output(proc)
             self.assertNotEqual(proc.returncode, 0, f"expected lint errors: {out}")
             self.assertTrue(
                 "MD013" in out or "MD022" in out,
                 f"expected MD013 or MD022 in output: {out}",
             )
-        finally:
-            path.unlink(missing_ok=True)
 
     def test_code_blocks_false_ignores_long_lines_in_fenced(self) -> None:
         content = """# T
@@ -894,17 +715,16 @@ class TestMD013Options(unittest.TestCase):
 """ + "x" * 30 + """
 ```
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"MD013": {"line_length": 20, "code_blocks": False}},
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {"MD013": {"line_length": 20, "code_blocks": False}},
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
 
-class TestMD033Options(unittest.TestCase):
+class TestMD033Options(_OptionsTestCase):
     """MD033/no-inline-html: allowed_elements."""
 
     def test_allowed_elements_restricts_html(self) -> None:
@@ -916,22 +736,21 @@ class TestMD033Options(unittest.TestCase):
 
 <b id="b">bold</b>
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc_default = run_markdownlint_with_config(
-                {"MD033": {"allowed_elements": ["a"]}}, path
-            )
-            self.assertNotEqual(proc_default.returncode, 0)
-            proc_allow_b = run_markdownlint_with_config(
-                {"MD033": {"allowed_elements": ["a", "b"]}},
-                path,
-            )
-            self.assertEqual(proc_allow_b.returncode, 0)
+        path = self._file
+        write_fixture(path, content)
+        proc_default = run_markdownlint_with_config(
+            {"MD033": {"allowed_elements": ["a"]}}, path
+        )
+        self.assertNotEqual(proc_default.returncode, 0)
+        proc_allow_b = run_markdownlint_with_config(
+            {"MD033": {"allowed_elements": ["a", "b"]}},
+            path,
+        )
+        self.assertEqual(proc_allow_b.returncode, 0)
 
 
-class TestHeadingTitleCaseOptions(unittest.TestCase):
-    """heading-title-case: lowercaseWords, lowercaseWordsReplaceDefault, excludePathPatterns."""
+class TestHeadingTitleCaseOptions(_OptionsTestCase):
+    """heading-title-case: lowercaseWords, lowercaseWordsReplaceDefault."""
 
     def test_lowercase_words_extends_default(self) -> None:
         content = """# T
@@ -942,14 +761,13 @@ class TestHeadingTitleCaseOptions(unittest.TestCase):
 
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {"heading-title-case": {"lowercaseWords": ["via"]}},
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {"heading-title-case": {"lowercaseWords": ["via"]}},
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
     def test_lowercase_words_replace_default(self) -> None:
         content = """# T
@@ -960,51 +778,225 @@ Content.
 
 Content.
 """
-        with tempfile.TemporaryDirectory(prefix="mdl_opts_") as tmp:
-            path = Path(tmp) / "f.md"
-            path.write_text(content, encoding="utf-8")
-            proc = run_markdownlint_with_config(
-                {
-                    "heading-title-case": {
-                        "lowercaseWords": ["and", "a", "the"],
-                        "lowercaseWordsReplaceDefault": True,
-                    },
+        path = self._file
+        write_fixture(path, content)
+        proc = run_markdownlint_with_config(
+            {
+                "heading-title-case": {
+                    "lowercaseWords": ["and", "a", "the"],
+                    "lowercaseWordsReplaceDefault": True,
                 },
-                path,
-            )
-            self.assertEqual(proc.returncode, 0)
+            },
+            path,
+        )
+        self.assertEqual(proc.returncode, 0)
 
-    def test_exclude_path_patterns_skips_rule(self) -> None:
-        content = """# T
 
-- [A](#all-lowercase-wrong)
+class TestConfigHelperContextManager(unittest.TestCase):
+    """temp_markdownlint_config context manager and config caching."""
 
-## all lowercase wrong
+    config_path: Path
 
-Content.
-"""
-        path, rel = _repo_tmp_file("excluded_titlecase.md")
-        path.write_text(content, encoding="utf-8")
-        try:
-            proc = run_markdownlint_with_config(
-                {
-                    "default": False,
-                    "heading-title-case": {
-                        "excludePathPatterns": ["**", "**/excluded_titlecase.md"],
-                    },
-                },
-                rel,
-            )
-            self.assertEqual(proc.returncode, 0)
-        finally:
-            path.unlink(missing_ok=True)
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One {"default": True} config shared by the class; tests compare later calls to it.
+        cls.config_path = cls.enterClassContext(temp_markdownlint_config({"default": True}))
 
+    def test_config_file_reused_for_same_overrides(self) -> None:
+        first = self.config_path
+        self.assertTrue(first.exists())
+        mtime_ns = first.stat().st_mtime_ns
+        with temp_markdownlint_config({"default": True}) as config_path:
+            self.assertEqual(config_path, first)
+        self.assertEqual(first.stat().st_mtime_ns, mtime_ns)
 
-class TestConfigHelperContextManager(unittest.TestCase):
-    """temp_markdownlint_config context manager cleans up."""
+    def test_config_file_differs_for_different_overrides(self) -> None:
+        with temp_markdownlint_config({"default": False}) as config_path:
+            self.assertNotEqual(config_path, self.config_path)
 
-    def test_config_file_removed_after_use(self) -> None:
-        with temp_markdownlint_config({"default": True}) as config_path:
+    def test_written_configs_removed_at_exit(self) -> None:
+        with temp_markdownlint_config({"MD013": False}) as config_path:
             self.assertTrue(config_path.exists())
-            p = config_path
-        self.assertFalse(p.exists())
+        saved = dict(helper._WRITTEN_CONFIGS)
+        try:
+            helper._remove_written_configs()
+            self.assertFalse(config_path.exists())
+        finally:
+            helper._WRITTEN_CONFIGS.update(saved)
+
+    def test_cached_base_config_not_mutated_by_callers(self) -> None:
+        first = helper._load_base_config()
+        first["default"] = "mutated"
+        second = helper._load_base_config()
+        self.assertNotEqual(second.get("default"), "mutated")
+
+    def test_base_config_json_sidecar_stamped_with_yaml(self) -> None:
+        helper._load_base_config()
+        source = _REPO_ROOT / ".markdownlint.yml"
+        sidecar = _REPO_ROOT / "tmp" / ".markdownlint.yml.json"
+        st = source.stat()
+        cached = helper._loads(sidecar.read_bytes())
+        self.assertEqual(cached["stamp"], [str(source.resolve()), st.st_mtime_ns, st.st_size])
+        self.assertEqual(cached["data"], helper._load_base_config())
+
+
+class TestRunMarkdownlintBatch(unittest.TestCase):
+    """run_markdownlint_batch splits one run's output per file."""
+
+    def test_output_lines_assigned_to_their_file(self) -> None:
+        stderr = "a.md:3 heading-min-words Too few words\nsub/b.md:1:2 MD041 First line\n"
+        proc = subprocess.CompletedProcess(
+            ["markdownlint-cli2"], 1, "Summary: 2 error(s)\n", stderr
+        )
+        with patch.object(helper, "run_markdownlint_with_config", return_value=proc):
+            results = run_markdownlint_batch({}, ["tmp/a.md", "/x/sub/b.md", "tmp/c.md"])
+        self.assertEqual(results["tmp/a.md"].returncode, 1)
+        self.assertIn("heading-min-words", results["tmp/a.md"].stderr)
+        self.assertEqual(results["/x/sub/b.md"].stderr, "sub/b.md:1:2 MD041 First line\n")
+        self.assertEqual(results["tmp/c.md"].returncode, 0)
+
+    def test_failed_run_reported_for_every_file(self) -> None:
+        proc = subprocess.CompletedProcess(["markdownlint-cli2"], 2, "", "config error\n")
+        with patch.object(helper, "run_markdownlint_with_config", return_value=proc):
+            results = run_markdownlint_batch({}, ["a.md", "b.md"])
+        self.assertEqual({r.returncode for r in results.values()}, {2})
+
+    def test_exit_1_without_file_lines_reported_for_every_file(self) -> None:
+        proc = subprocess.CompletedProcess(["markdownlint-cli2"], 1, "", "Cannot find module\n")
+        with patch.object(helper, "run_markdownlint_with_config", return_value=proc):
+            results = run_markdownlint_batch({}, ["a.md", "b.md"])
+        self.assertEqual({r.returncode for r in results.values()}, {1})
+        self.assertEqual({r.stderr for r in results.values()}, {"Cannot find module\n"})
+
+    def test_duplicate_file_names_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            run_markdownlint_batch({}, ["x/a.md", "y/a.md"])
+
+
+class TestLintResultCache(unittest.TestCase):
+    """MARKDOWNLINT_TEST_CACHE=1: results reused for equal inputs, invalidated by rule edits."""
+
+    def setUp(self) -> None:
+        root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        rules = root / "markdownlint-rules"
+        rules.mkdir()
+        (rules / "rule.js").write_text('require("./utils.js");\n', encoding="utf-8")
+        self._utils = rules / "utils.js"
+        self._utils.write_text("module.exports = {};\n", encoding="utf-8")
+        (root / ".markdownlint-cli2.jsonc").write_text(
+            '{"customRules": ["markdownlint-rules/rule.js"]}', encoding="utf-8"
+        )
+        self._package = root / "node_modules" / "markdownlint" / "package.json"
+        self._package.parent.mkdir(parents=True)
+        self._package.write_text('{"version": "0.37.0"}', encoding="utf-8")
+        self.enterContext(patch.dict(os.environ, {"MARKDOWNLINT_TEST_CACHE": "1"}))
+        self.enterContext(patch.object(helper, "_repo_root", return_value=root))
+        self._run = MagicMock(
+            return_value=subprocess.CompletedProcess(["markdownlint-cli2"], 1, "out", "err")
+        )
+
+    def _cached(self, *key_parts: bytes) -> subprocess.CompletedProcess:
+        return helper._cached_result(list(key_parts), self._run)
+
+    def test_same_inputs_hit_cache(self) -> None:
+        first = self._cached(b"config", b"content")
+        second = self._cached(b"config", b"content")
+        self._run.assert_called_once()
+        self.assertEqual(
+            (second.args, second.returncode, second.stdout, second.stderr),
+            (first.args, first.returncode, first.stdout, first.stderr),
+        )
+
+    def test_different_content_misses_cache(self) -> None:
+        self._cached(b"config", b"content")
+        self._cached(b"config", b"other content")
+        self.assertEqual(self._run.call_count, 2)
+
+    def test_shared_rule_module_edit_invalidates(self) -> None:
+        self._cached(b"config", b"content")
+        self._utils.write_text("module.exports = { changed: true };\n", encoding="utf-8")
+        self._cached(b"config", b"content")
+        self.assertEqual(self._run.call_count, 2)
+
+    def test_markdownlint_upgrade_invalidates(self) -> None:
+        self._cached(b"config", b"content")
+        self._package.write_text('{"version": "0.38.0"}', encoding="utf-8")
+        self._cached(b"config", b"content")
+        self.assertEqual(self._run.call_count, 2)
+
+
+class TestMarkdownlintWorkerFallback(unittest.TestCase):
+    """A worker that fails a job is dropped and runs fall back to spawning the CLI."""
+
+    def test_broken_worker_dropped_and_cli_spawned(self) -> None:
+        dead = MagicMock()
+        dead.run.side_effect = BrokenPipeError()
+        spawned = subprocess.CompletedProcess(["markdownlint-cli2"], 0, "", "")
+        with patch.dict(os.environ, {"MARKDOWNLINT_WORKER": "1"}), patch.multiple(
+            helper,
+            _shared_worker=MagicMock(return_value=dead),
+            _WORKER_DEAD=threading.Event(),
+            _markdownlint_cmd=MagicMock(return_value=("markdownlint-cli2",)),
+        ), patch.object(helper.subprocess, "run", return_value=spawned) as run:
+            self.assertIs(helper.run_markdownlint(["a.md"], _REPO_ROOT), spawned)
+            self.assertIs(helper.run_markdownlint(["b.md"], _REPO_ROOT), spawned)
+            self.assertFalse(start_markdownlint_worker())
+        dead.run.assert_called_once()
+        dead.kill.assert_called_once()
+        self.assertEqual(run.call_count, 2)
+
+    def test_invalid_reply_raises_os_error(self) -> None:
+        worker = object.__new__(helper._MarkdownlintWorker)
+        worker._lock = threading.Lock()
+        worker._proc = MagicMock()
+        worker._proc.stdout.readline.return_value = "rule debug output\n"
+        with self.assertRaises(OSError):
+            worker.run(["a.md"], _REPO_ROOT)
+
+
+@unittest.skipUnless(
+    shutil.which("node")
+    and (_REPO_ROOT / "node_modules" / "markdownlint-cli2" / "package.json").exists(),
+    "markdownlint-cli2 not installed in node_modules",
+)
+class TestMarkdownlintWorkerMatchesCli(unittest.TestCase):
+    """markdownlint_worker.mjs returns what the spawned markdownlint-cli2 CLI does."""
+
+    _CONTENT = """# T
+
+## lowercase heading
+
+Arrow → here.
+"""
+
+    def setUp(self) -> None:
+        if not start_markdownlint_worker():
+            self.skipTest("markdownlint worker disabled (MARKDOWNLINT_WORKER=0)")
+        self._path, _ = _repo_tmp_file("worker_vs_cli.md")
+        self.addCleanup(self._path.unlink, missing_ok=True)
+        config = helper._materialize_config(
+            {"default": False, "heading-title-case": True, "ascii-only": True}
+        )
+        self._config_args = ["--config", str(config)]
+
+    def _run_both(self, fix: bool) -> Dict[str, Tuple[int, str, str, str]]:
+        """Lint a fresh copy of _CONTENT with the worker, then with the CLI."""
+        args = [*self._config_args, *(["--fix"] if fix else []), self._path.name]
+        results = {}
+        for mode in ("1", "0"):
+            write_fixture(self._path, self._CONTENT)
+            with patch.dict(os.environ, {"MARKDOWNLINT_WORKER": mode}):
+                proc = helper.run_markdownlint(args, self._path.parent)
+            content = self._path.read_text(encoding="utf-8")
+            results[mode] = (proc.returncode, proc.stdout, proc.stderr, content)
+        return results
+
+    def test_lint_run_matches_cli(self) -> None:
+        results = self._run_both(fix=False)
+        self.assertNotEqual(results["0"][0], 0, "fixture should report errors")
+        self.assertEqual(results["1"], results["0"])
+
+    def test_fix_run_matches_cli(self) -> None:
+        results = self._run_both(fix=True)
+        self.assertNotEqual(results["0"][3], self._CONTENT, "--fix should change the file")
+        self.assertEqual(results["1"], results["0"])
@@ -9,20 +9,74 @@ integration-style tests (skipped when unavailable).
 
 from __future__ import annotations
 
+import functools
+import io
+import shutil
+import tempfile
+import types
 import unittest
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import verify_markdownlint_fixtures as v
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 _MD_DIR = _REPO_ROOT / "md_test_files"
 _EXPECT_PATH = _MD_DIR / "expected_errors.yml"
-
-
+_EXPECT_EXISTS = _EXPECT_PATH.exists()
+_LONG_FIXTURE_PATH = _MD_DIR / "negative_document_length.md"
+# Probed once at import: a local or PATH markdownlint-cli2, or npx to fetch it.
+_MARKDOWNLINT_AVAILABLE = bool(
+    (_REPO_ROOT / "node_modules" / ".bin" / "markdownlint-cli2").exists()
+    or shutil.which("markdownlint-cli2")
+    or shutil.which("npx")
+)
+_SKIP_INTEGRATION = unittest.skipUnless(
+    _MARKDOWNLINT_AVAILABLE and _EXPECT_EXISTS, "markdownlint/expectations not available"
+)
+
+
+@contextmanager
+def _fake_run(returncode, stdout, stderr):
+    """Swap subprocess.run for a stub returning a canned result (no MagicMock; no call checks)."""
+    result = types.SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+    original = v.subprocess.run
+    v.subprocess.run = lambda *args, **kwargs: result
+    try:
+        yield
+    finally:
+        v.subprocess.run = original
+
+
+@contextmanager
+def _fake_popen(returncode, output):
+    """
+    Swap subprocess.Popen for a stub whose merged stdout yields output's lines.
+
+    Yields the list of argv the stub was called with.
+    """
+    calls = []
+
+    def popen(argv, **kwargs):
+        calls.append(argv)
+        proc = MagicMock(stdout=io.StringIO(output))
+        proc.__enter__.return_value = proc
+        proc.wait.return_value = returncode
+        return proc
+
+    original = v.subprocess.Popen
+    v.subprocess.Popen = popen
+    try:
+        yield calls
+    finally:
+        v.subprocess.Popen = original
+
+
+@functools.lru_cache(maxsize=1)
 def _fixture_files():
-    """Fixture list from verifier; tests rely on expected_errors.yml + list_fixture_files()."""
-    return v.list_fixture_files()
+    """Fixture list from verifier, computed once; tests rely on expected_errors.yml + it."""
+    return tuple(v.list_fixture_files())
 
 
 def _first_fixture_path():
@@ -31,11 +85,12 @@ def _first_fixture_path():
     return files[0] if files else None
 
 
+@functools.lru_cache(maxsize=1)
 def _expectations_from_yml():
-    """Load expected_errors.yml; return dict or None if missing."""
-    if not _EXPECT_PATH.exists():
+    """Load expected_errors.yml once; return a read-only mapping, or None if missing."""
+    if not _EXPECT_EXISTS:
         return None
-    return v.load_expected_errors(_EXPECT_PATH)
+    return types.MappingProxyType(v.load_expected_errors(_EXPECT_PATH))
 
 
 class TestRepoRoot(unittest.TestCase):
@@ -52,6 +107,17 @@ class TestRepoRoot(unittest.TestCase):
         self.assertTrue((root / "md_test_files").is_dir(), "md_test_files dir missing")
 
 
+class TestFixtureLabel(unittest.TestCase):
+    """Tests for fixture_label()."""
+
+    def test_matches_relative_to_for_fixtures_and_other_paths(self):
+        root = v.repo_root()
+        paths = [*_fixture_files(), root / "md_test_files" / "sub" / "x.md", root / "README.md"]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(v.fixture_label(path), path.relative_to(root).as_posix())
+
+
 class TestFindMarkdownlintCmd(unittest.TestCase):
     """Tests for find_markdownlint_cmd()."""
 
@@ -114,7 +180,7 @@ class TestLoadExpectedErrors(unittest.TestCase):
             v.load_expected_errors(Path("/nonexistent/expected_errors.yml"))
 
     def test_valid_yaml_returns_dict(self):
-        if not _EXPECT_PATH.exists():
+        if not _EXPECT_EXISTS:
             self.skipTest("expected_errors.yml not found")
         data = v.load_expected_errors(_EXPECT_PATH)
         self.assertIsInstance(data, dict)
@@ -125,29 +191,30 @@ class TestLoadExpectedErrors(unittest.TestCase):
             "expected_errors.yml keys must match list_fixture_files()",
         )
 
+    def test_json_sidecar_reused_until_yaml_changes(self):
+        """A second load comes from tmp/<name>.json; editing the YAML invalidates it."""
+        with tempfile.TemporaryDirectory() as root:
+            expect = Path(root) / "expected_errors.yml"
+            expect.write_text("a.md:\n  errors: []\n", encoding="utf-8")
+            with patch.object(v, "repo_root", return_value=Path(root)):
+                self.assertEqual(v.load_expected_errors(expect), {"a.md": {"errors": []}})
+                sidecar = Path(root) / "tmp" / "expected_errors.yml.json"
+                self.assertTrue(sidecar.exists())
+                with patch.object(v, "load_expected_errors_from_text") as parse:
+                    self.assertEqual(v.load_expected_errors(expect), {"a.md": {"errors": []}})
+                parse.assert_not_called()
+                expect.write_text("bb.md:\n  errors: []\n", encoding="utf-8")
+                self.assertEqual(v.load_expected_errors(expect), {"bb.md": {"errors": []}})
+
     def test_invalid_yaml_raises(self):
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write("not: valid: yaml: [")
-            f.flush()
-            try:
-                with self.assertRaises(ValueError) as ctx:
-                    v.load_expected_errors(Path(f.name))
-                self.assertIn("Invalid YAML", str(ctx.exception))
-            finally:
-                Path(f.name).unlink(missing_ok=True)
+        with self.assertRaises(ValueError) as ctx:
+            v.load_expected_errors_from_text("not: valid: yaml: [", "bad.yml")
+        self.assertIn("Invalid YAML in bad.yml", str(ctx.exception))
 
     def test_yaml_not_dict_raises(self):
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-            f.write("- list\n- not dict\n")
-            f.flush()
-            try:
-                with self.assertRaises(ValueError) as ctx:
-                    v.load_expected_errors(Path(f.name))
-                self.assertIn("must be a YAML object", str(ctx.exception))
-            finally:
-                Path(f.name).unlink(missing_ok=True)
+        with self.assertRaises(ValueError) as ctx:
+            v.load_expected_errors_from_text("- list\n- not dict\n")
+        self.assertIn("must be a YAML object", str(ctx.exception))
 
 
 class TestParseExpectationsFromData(unittest.TestCase):
@@ -222,6 +289,13 @@ class TestParseExpectationsFromData(unittest.TestCase):
             self._parse({"errors": [{"line": 1, "rule": "X", "column": 0}]})
         self.assertIn("column", str(ctx.exception))
 
+    def test_boolean_line_or_column_raises(self):
+        """YAML true/false are rejected even though bool is an int subclass."""
+        for item in ({"line": True, "rule": "X"}, {"line": 1, "rule": "X", "column": True}):
+            with self.subTest(item=item):
+                with self.assertRaises(ValueError):
+                    self._parse({"errors": [item]})
+
     def test_message_contains_parsed(self):
         data = {
             "errors": [
@@ -274,6 +348,21 @@ class TestParseMarkdownlintOutput(unittest.TestCase):
         self.assertIn("getting", errors[0].message)
         self.assertIn("capitalized", errors[0].message)
 
+    def test_fast_path_and_regex_fallback_agree(self):
+        """Scanned lines (with or without severity) and regex-fallback lines parse the same."""
+        label = "md_test_files/foo.md"
+        output = (
+            f"{label}:7:4 heading-title-case [Word x]\n"
+            f"{label}:7:4 error heading-title-case [Word x]\n"
+            f"{label}:7:4\theading-title-case  [Word x]\n"
+        )
+        errors = v.parse_markdownlint_output(output, label)
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(
+            {(e.line, e.column, e.rule, e.message) for e in errors},
+            {(7, 4, "heading-title-case", "[Word x]")},
+        )
+
     def test_empty_output_returns_empty_list(self):
         errors = v.parse_markdownlint_output("", "any.md")
         self.assertEqual(errors, [])
@@ -314,35 +403,47 @@ class TestToCountMap(unittest.TestCase):
 class TestVerifyFile(unittest.TestCase):
     """Tests for verify_file(): integration (real markdownlint) and exit-code mismatch (mocked)."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.cmd = v.find_markdownlint_cmd()
+        cls.expectations = _expectations_from_yml()
+        # The integration tests' fixtures are linted together in one markdownlint run.
+        cls._actual = {}
+        cls._lint_error = None
+        if cls.expectations is None or not _MARKDOWNLINT_AVAILABLE:
+            return
+        paths = [
+            p for p in (_first_fixture_path(), _LONG_FIXTURE_PATH)
+            if p is not None and p.name in cls.expectations
+        ]
+        if _LONG_FIXTURE_PATH in paths:
+            v.ensure_long_document_fixture(_LONG_FIXTURE_PATH)
+            cls.addClassCleanup(_LONG_FIXTURE_PATH.unlink, missing_ok=True)
+        try:
+            cls._actual = v.lint_files(cls.cmd, paths)
+        except OSError as e:
+            cls._lint_error = e
+
+    def _verify_batched(self, path):
+        """Check path's result from the setUpClass run; skip if markdownlint was not runnable."""
+        if self._lint_error is not None:
+            self.skipTest(f"markdownlint not runnable: {self._lint_error}")
+        v.verify_lint_result(path, self.expectations, *self._actual[path])
+
+    @_SKIP_INTEGRATION
     def test_verify_file_positive_integration(self):
-        """Run verify_file on first fixture for real; skip if markdownlint unavailable."""
+        """Check the first fixture against a real run; skip if markdownlint unavailable."""
         path = _first_fixture_path()
-        if path is None or not _EXPECT_PATH.exists():
-            self.skipTest("fixtures or expected_errors.yml not found")
-        cmd = v.find_markdownlint_cmd()
-        expectations = _expectations_from_yml()
-        try:
-            v.verify_file(cmd, path, expectations)
-        except (OSError, FileNotFoundError) as e:
-            self.skipTest(f"markdownlint not runnable: {e}")
+        if path is None:
+            self.skipTest("no fixtures found")
+        self._verify_batched(path)
 
+    @_SKIP_INTEGRATION
     def test_verify_document_length_generated_fixture(self):
-        """Generate a 1501-line fixture, verify document-length error, then remove file."""
-        path = _MD_DIR / "negative_document_length.md"
-        if not _EXPECT_PATH.exists():
-            self.skipTest("expected_errors.yml not found")
-        expectations = _expectations_from_yml()
-        if path.name not in expectations:
+        """Check the generated 1501-line fixture reports document-length."""
+        if _LONG_FIXTURE_PATH.name not in self.expectations:
             self.skipTest("negative_document_length.md not in expected_errors.yml")
-        v.ensure_long_document_fixture(path)
-        try:
-            cmd = v.find_markdownlint_cmd()
-            try:
-                v.verify_file(cmd, path, expectations)
-            except (OSError, FileNotFoundError) as e:
-                self.skipTest(f"markdownlint not runnable: {e}")
-        finally:
-            path.unlink(missing_ok=True)
+        self._verify_batched(_LONG_FIXTURE_PATH)
 
     def test_verify_file_raises_when_exit_code_mismatch(self):
         """Exit code mismatch (expect 0 errors, got non-zero) raises AssertionError."""
@@ -350,12 +451,7 @@ class TestVerifyFile(unittest.TestCase):
         if path is None:
             self.skipTest("no fixtures found")
         expectations = {path.name: {"errors": []}}
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": "", "stderr": "error"},
-            )()
+        with _fake_run(1, "", "error"):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
             self.assertIn("exit code", str(ctx.exception))
@@ -377,16 +473,12 @@ class TestVerifyFile(unittest.TestCase):
             },
         }
         output = f"md_test_files/{path.name}:1 MD001 Some other message\n"
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": output, "stderr": ""},
-            )()
+        with _fake_run(1, output, ""):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
-            self.assertIn("message", str(ctx.exception).lower())
-            self.assertIn("message_contains", str(ctx.exception))
+            msg = str(ctx.exception)
+            self.assertIn("Unexpected error message", msg)
+            self.assertIn("message_contains", msg)
 
     def test_verify_file_raises_when_no_expectations_for_file(self):
         path = _first_fixture_path()
@@ -402,12 +494,7 @@ class TestVerifyFile(unittest.TestCase):
         if path is None:
             self.skipTest("no fixtures found")
         expectations = {path.name: {"errors": [{"line": 1, "rule": "X"}]}}
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 0, "stdout": "", "stderr": ""},
-            )()
+        with _fake_run(0, "", ""):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
             self.assertIn("exit code", str(ctx.exception))
@@ -422,12 +509,7 @@ class TestVerifyFile(unittest.TestCase):
             f"md_test_files/{path.name}:1 X msg1\n"
             f"md_test_files/{path.name}:2 X msg2\n"
         )
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": output, "stderr": ""},
-            )()
+        with _fake_run(1, output, ""):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
             self.assertIn("error count", str(ctx.exception))
@@ -449,12 +531,7 @@ class TestVerifyFile(unittest.TestCase):
             f"md_test_files/{path.name}:1 X msg1\n"
             f"md_test_files/{path.name}:2 X msg2\n"
         )
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": output, "stderr": ""},
-            )()
+        with _fake_run(1, output, ""):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
             self.assertIn("expected 2, got 1", str(ctx.exception))
@@ -476,16 +553,35 @@ class TestVerifyFile(unittest.TestCase):
             f"md_test_files/{path.name}:1:5 X msg1\n"
             f"md_test_files/{path.name}:1:10 X msg2\n"
         )
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": output, "stderr": ""},
-            )()
+        with _fake_run(1, output, ""):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
             self.assertIn("column", str(ctx.exception))
 
+    def test_verify_file_lists_every_missing_column(self):
+        """Each expected column missing from the output gets its own diff line."""
+        path = _first_fixture_path()
+        if path is None:
+            self.skipTest("no fixtures found")
+        expectations = {
+            path.name: {
+                "errors": [
+                    {"line": 1, "rule": "X", "column": 5},
+                    {"line": 2, "rule": "Y", "column": 7},
+                ],
+            },
+        }
+        output = (
+            f"md_test_files/{path.name}:1:6 X msg1\n"
+            f"md_test_files/{path.name}:2:8 Y msg2\n"
+        )
+        with _fake_run(1, output, ""):
+            with self.assertRaises(AssertionError) as ctx:
+                v.verify_file(["markdownlint-cli2"], path, expectations)
+        msg = str(ctx.exception)
+        self.assertIn("- line 1 rule X column 5: expected 1, got 0", msg)
+        self.assertIn("- line 2 rule Y column 7: expected 1, got 0", msg)
+
     def test_verify_file_raises_when_expected_line_rule_not_in_actual(self):
         """Expected at line 99 rule X but actual has only line 1 (line/rule multiset mismatch)."""
         path = _first_fixture_path()
@@ -499,12 +595,7 @@ class TestVerifyFile(unittest.TestCase):
             },
         }
         output = f"md_test_files/{path.name}:1 X msg\n"
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": output, "stderr": ""},
-            )()
+        with _fake_run(1, output, ""):
             with self.assertRaises(AssertionError) as ctx:
                 v.verify_file(["markdownlint-cli2"], path, expectations)
             self.assertIn("expected 0, got 1", str(ctx.exception))
@@ -516,83 +607,127 @@ class TestVerifyFile(unittest.TestCase):
             self.skipTest("no fixtures found")
         expectations = {path.name: {"errors": [{"line": 1, "rule": "X"}]}}
         line_out = f"md_test_files/{path.name}:1 X msg\n"
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": line_out, "stderr": ""},
-            )()
+        with _fake_run(1, line_out, ""):
             v.verify_file(["markdownlint-cli2"], path, expectations)
-        with patch("verify_markdownlint_fixtures.subprocess.run") as run:
-            run.return_value = type(
-                "Result",
-                (),
-                {"returncode": 1, "stdout": "", "stderr": line_out},
-            )()
+        with _fake_run(1, "", line_out):
             v.verify_file(["markdownlint-cli2"], path, expectations)
 
+    def test_lint_files_splits_output_per_file(self):
+        """lint_files gives each file its own lines; files without lines get exit code 0."""
+        md_dir = v.repo_root() / "md_test_files"
+        first, second = md_dir / "a.md", md_dir / "b.md"
+        out = "md_test_files/a.md:1 X msg\nSummary: 2 error(s)\nmd_test_files/a.md:3 Y msg\n"
+        with _fake_popen(1, out) as calls:
+            actual = v.lint_files(["markdownlint-cli2"], [first, second])
+        self.assertEqual(
+            calls, [["markdownlint-cli2", "md_test_files/a.md", "md_test_files/b.md"]]
+        )
+        self.assertEqual(
+            actual[first], (1, "md_test_files/a.md:1 X msg\nmd_test_files/a.md:3 Y msg")
+        )
+        self.assertEqual(actual[second], (0, ""))
+
+    def test_lint_files_unattributed_failure_goes_to_every_file(self):
+        """A failed run with no per-file lines reports its exit code and output for every file."""
+        md_dir = v.repo_root() / "md_test_files"
+        paths = [md_dir / "a.md", md_dir / "b.md"]
+        with _fake_popen(1, "boom\n"):
+            actual = v.lint_files(["markdownlint-cli2"], paths)
+        self.assertEqual(actual, {p: (1, "boom") for p in paths})
+
+    def test_lint_files_crashed_run_keeps_file_lines(self):
+        """A crashed run (exit 2) gives each file its own lines plus the unattributed ones."""
+        md_dir = v.repo_root() / "md_test_files"
+        first, second = md_dir / "a.md", md_dir / "b.md"
+        with _fake_popen(2, "md_test_files/a.md:1 X msg\nTypeError: boom\n"):
+            actual = v.lint_files(["markdownlint-cli2"], [first, second])
+        self.assertEqual(actual[first], (2, "md_test_files/a.md:1 X msg\nTypeError: boom"))
+        self.assertEqual(actual[second], (2, "TypeError: boom"))
+
 
 class TestMain(unittest.TestCase):
     """Tests for main()."""
 
-    def test_main_returns_zero_when_all_pass(self):
-        fixture_list = _fixture_files()
-        expectations = _expectations_from_yml()
-        if not fixture_list or expectations is None:
+    @classmethod
+    def setUpClass(cls):
+        cls.fixture_list = _fixture_files()
+        cls.expectations = _expectations_from_yml()
+
+    def setUp(self):
+        if not self.fixture_list or self.expectations is None:
             self.skipTest("fixtures or expected_errors.yml not found")
-        with patch("sys.argv", ["prog"]):
-            with patch.object(v, "find_markdownlint_cmd", return_value=["markdownlint-cli2"]):
-                with patch.object(v, "list_fixture_files", return_value=fixture_list):
-                    with patch.object(v, "load_expected_errors", return_value=expectations):
-                        with patch.object(v, "verify_file"):
-                            result = v.main(quiet=True)
+
+    @contextmanager
+    def _patch_main(self, fixtures, argv=("prog",)):
+        """
+        Patch sys.argv and main()'s collaborators at once; yields patch.multiple's mocks.
+
+        lint_files returns a clean (0, "") result per file and verify_lint_result is a
+        MagicMock; the long fixture is not generated either (TestVerifyFile writes it once).
+        """
+        with patch("sys.argv", list(argv)), patch.multiple(
+            v,
+            ensure_long_document_fixture=MagicMock(),
+            find_markdownlint_cmd=MagicMock(return_value=["markdownlint-cli2"]),
+            list_fixture_files=MagicMock(return_value=fixtures),
+            load_expected_errors=MagicMock(return_value=self.expectations),
+            lint_files=MagicMock(side_effect=lambda cmd, paths: {p: (0, "") for p in paths}),
+            verify_lint_result=DEFAULT,
+        ) as mocks:
+            yield mocks
+
+    def test_main_returns_zero_when_all_pass(self):
+        with self._patch_main(self.fixture_list) as mocks:
+            result = v.main(quiet=True)
         self.assertEqual(result, 0)
+        self.assertEqual(mocks["verify_lint_result"].call_count, len(self.fixture_list))
+
+    def test_main_lints_all_fixtures_in_one_run_when_serial(self):
+        """--jobs 1 lints every fixture in a single markdownlint run."""
+        with self._patch_main(self.fixture_list, ("prog", "--jobs", "1")):
+            self.assertEqual(v.main(quiet=True), 0)
+            v.lint_files.assert_called_once_with(["markdownlint-cli2"], self.fixture_list)
+
+    def test_main_jobs_verifies_every_fixture(self):
+        """--jobs N splits fixtures into N batches and checks each fixture once."""
+        fixture_list = self.fixture_list
+        with self._patch_main(fixture_list, ("prog", "--jobs", "4")) as mocks:
+            verify = mocks["verify_lint_result"]
+            self.assertEqual(v.main(quiet=True), 0)
+            self.assertEqual(v.lint_files.call_count, min(4, len(fixture_list)))
+            verify.side_effect = AssertionError("fail")
+            with patch("sys.stderr"):
+                self.assertEqual(v.main(quiet=True), 1)
+        checked = [c.args[0] for c in verify.call_args_list]
+        self.assertCountEqual(checked, list(fixture_list) * 2)
+
+    def test_main_reports_every_fixture_when_markdownlint_fails_to_start(self):
+        with self._patch_main(self.fixture_list[:2]), patch("sys.stderr") as mock_stderr:
+            v.lint_files.side_effect = FileNotFoundError("markdownlint-cli2")
+            self.assertEqual(v.main(quiet=True), 1)
+        out = "".join(c[0][0] for c in mock_stderr.write.call_args_list)
+        self.assertIn(f"failed ({len(self.fixture_list[:2])} file(s))", out)
 
     def test_main_prints_success_message(self):
-        fixture_list = _fixture_files()
-        expectations = _expectations_from_yml()
-        if not fixture_list or expectations is None:
-            self.skipTest("fixtures or expected_errors.yml not found")
-        with patch("sys.argv", ["prog"]):
-            with patch.object(v, "find_markdownlint_cmd", return_value=["markdownlint-cli2"]):
-                with patch.object(v, "list_fixture_files", return_value=fixture_list[:1]):
-                    with patch.object(v, "load_expected_errors", return_value=expectations):
-                        with patch.object(v, "verify_file"):
-                            with patch("sys.stdout") as mock_stdout:
-                                self.assertEqual(v.main(), 0)
-                            mock_stdout.write.assert_called()
-                            out = "".join(c[0][0] for c in mock_stdout.write.call_args_list)
-                            self.assertIn("All markdownlint", out)
+        with self._patch_main(self.fixture_list[:1]), patch("sys.stdout") as mock_stdout:
+            self.assertEqual(v.main(), 0)
+        mock_stdout.write.assert_called()
+        out = "".join(c[0][0] for c in mock_stdout.write.call_args_list)
+        self.assertIn("All markdownlint", out)
 
     def test_main_returns_one_on_failure(self):
-        fixture_list = _fixture_files()
-        expectations = _expectations_from_yml()
-        if not fixture_list or expectations is None:
-            self.skipTest("fixtures or expected_errors.yml not found")
-        with patch("sys.argv", ["prog"]):
-            with patch.object(v, "find_markdownlint_cmd", return_value=["markdownlint-cli2"]):
-                with patch.object(v, "list_fixture_files", return_value=fixture_list[:1]):
-                    with patch.object(v, "load_expected_errors", return_value=expectations):
-                        with patch.object(v, "verify_file", side_effect=AssertionError("fail")):
-                            with patch("sys.stderr"):
-                                result = v.main(quiet=True)
+        with self._patch_main(self.fixture_list[:1]) as mocks, patch("sys.stderr"):
+            mocks["verify_lint_result"].side_effect = AssertionError("fail")
+            result = v.main(quiet=True)
         self.assertEqual(result, 1)
 
     def test_main_verbose_writes_per_fixture(self):
-        fixture_list = _fixture_files()
-        expectations = _expectations_from_yml()
-        if not fixture_list or expectations is None:
-            self.skipTest("fixtures or expected_errors.yml not found")
-        with patch.object(v, "find_markdownlint_cmd", return_value=["markdownlint-cli2"]):
-            with patch.object(v, "list_fixture_files", return_value=fixture_list[:1]):
-                with patch.object(v, "load_expected_errors", return_value=expectations):
-                    with patch.object(v, "verify_file"):
-                        with patch("sys.argv", ["prog", "--verbose"]):
-                            with patch("sys.stderr") as mock_stderr:
-                                v.main(quiet=True)
-                        self.assertGreater(mock_stderr.write.call_count, 0)
-                        calls = "".join(c[0][0] for c in mock_stderr.write.call_args_list)
-                        self.assertIn("Verifying", calls)
+        argv = ("prog", "--verbose")
+        with self._patch_main(self.fixture_list[:1], argv), patch("sys.stderr") as mock_stderr:
+            v.main(quiet=True)
+        self.assertGreater(mock_stderr.write.call_count, 0)
+        calls = "".join(c[0][0] for c in mock_stderr.write.call_args_list)
+        self.assertIn("Verifying", calls)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 Verify markdownlint fixture expectations from md_test_files/expected_errors.yml.
 
 Expected errors are keyed by fixture filename (e.g. positive_*.md, negative_*.md).
-The verifier runs markdownlint-cli2 on each fixture and asserts:
+The verifier lints the fixtures in batched markdownlint-cli2 runs and asserts, per fixture:
 - exit code matches (0 for total=0, non-zero otherwise)
 - total error count matches
 - the multiset of (line, rule) or (line, rule, column) matches exactly (duplicates allowed).
@@ -17,20 +17,44 @@ The verifier runs markdownlint-cli2 on each fixture and asserts:
 from __future__ import annotations
 
 import argparse
+import functools
+import json
 import os
 import re
 import subprocess  # nosec B404 (tooling script runs local commands)
 import sys
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when orjson is not installed
+    orjson = None
+
 LONG_FIXTURE_LINES = 1501
 
 
-@dataclass(frozen=True)
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj as compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(frozen=True, slots=True)
 class ExpectedError:
     """
     A single expected markdownlint error: line, rule, optional column (1-based),
@@ -45,21 +69,43 @@ class ExpectedError:
     message: Optional[str] = None  # Set when parsing actual output; not from YAML
 
 
+@functools.lru_cache(maxsize=1)
 def repo_root() -> Path:
     """Return the repository root directory (parent of this script's directory)."""
     return Path(__file__).resolve().parents[1]
 
 
+@functools.lru_cache(maxsize=4)
+def _markdownlint_cmd_for(root: Path) -> Tuple[str, ...]:
+    """Probe root's node_modules once per process; see find_markdownlint_cmd()."""
+    local = root / "node_modules" / ".bin" / "markdownlint-cli2"
+    if local.exists() and os.access(local, os.X_OK):
+        return (str(local),)
+    return ("npx", "markdownlint-cli2")
+
+
 def find_markdownlint_cmd() -> List[str]:
     """
     Return the command to run markdownlint-cli2.
 
     Prefer local node_modules/.bin/markdownlint-cli2; fallback to npx markdownlint-cli2.
+    The filesystem probe is cached per repo root; each call returns a new list.
     """
-    local = repo_root() / "node_modules" / ".bin" / "markdownlint-cli2"
-    if local.exists() and os.access(local, os.X_OK):
-        return [str(local)]
-    return ["npx", "markdownlint-cli2"]
+    return list(_markdownlint_cmd_for(repo_root()))
+
+
+def fixture_label(file_path: Path) -> str:
+    """
+    Repo-relative POSIX path markdownlint prints for file_path (e.g. md_test_files/foo.md).
+
+    Files directly in md_test_files/ (every fixture) are labeled by string slicing; other
+    paths fall back to Path.relative_to().
+    """
+    path_str = str(file_path)
+    md_prefix = os.path.join(str(repo_root()), "md_test_files", "")
+    if path_str.startswith(md_prefix) and os.sep not in path_str[len(md_prefix):]:
+        return "md_test_files/" + path_str[len(md_prefix):]
+    return file_path.relative_to(repo_root()).as_posix()
 
 
 def ensure_long_document_fixture(path: Path) -> None:
@@ -74,12 +120,26 @@ def ensure_long_document_fixture(path: Path) -> None:
 def list_fixture_files() -> List[Path]:
     """Return fixture paths: sorted positive_*.md plus sorted negative_*.md in md_test_files."""
     md_dir = repo_root() / "md_test_files"
-    positives = sorted(md_dir.glob("positive_*.md"))
-    negatives = sorted(md_dir.glob("negative_*.md"))
-    long_fixture = md_dir / "negative_document_length.md"
-    if long_fixture not in negatives:
-        negatives = sorted(negatives + [long_fixture])
-    return [*positives, *negatives]
+    positives: List[str] = []
+    negatives: List[str] = []
+    # One scandir pass; DirEntry.is_file uses the type readdir already returned (no stat).
+    with os.scandir(md_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".md") or not entry.is_file(follow_symlinks=False):
+                continue
+            if entry.name.startswith("positive_"):
+                positives.append(entry.name)
+            elif entry.name.startswith("negative_"):
+                negatives.append(entry.name)
+    # The long fixture is generated on demand, so list it even before it exists.
+    if "negative_document_length.md" not in negatives:
+        negatives.append("negative_document_length.md")
+    return [md_dir / name for name in (*sorted(positives), *sorted(negatives))]
+
+
+def _is_int(value: object) -> bool:
+    """True for a real int; bool is excluded even though it subclasses int."""
+    return isinstance(value, int) and not isinstance(value, bool)
 
 
 def _parse_one_error(item: object, idx: int, file_path: Path) -> ExpectedError:
@@ -91,38 +151,93 @@ def _parse_one_error(item: object, idx: int, file_path: Path) -> ExpectedError:
     line = item.get("line")
     rule = item.get("rule")
     column = item.get("column")
-    if not isinstance(line, int) or line < 1 or not isinstance(rule, str) or not rule.strip():
+    # One short-circuit check per field; true/false must not pass as 1/0 (bool subclasses int).
+    if not (_is_int(line) and line >= 1 and isinstance(rule, str) and rule.strip()):
         raise ValueError(
             f"Invalid errors[{idx}] in {file_path.as_posix()} expectations "
             "(need {line:int>=1, rule:str})."
         )
-    if column is not None and (not isinstance(column, int) or column < 1):
+    if not (column is None or (_is_int(column) and column >= 1)):
         raise ValueError(
             f"Invalid errors[{idx}] in {file_path.as_posix()} expectations "
             '(optional "column" must be int >= 1).'
         )
     msg_contains = item.get("message_contains")
-    if msg_contains is not None and not isinstance(msg_contains, str):
+    if not (msg_contains is None or isinstance(msg_contains, str)):
         raise ValueError(
             f"Invalid errors[{idx}] in {file_path.as_posix()} expectations "
             '(optional "message_contains" must be a string).'
         )
-    col = column if isinstance(column, int) else None
-    msg_c = msg_contains if isinstance(msg_contains, str) else None
-    return ExpectedError(line=line, rule=rule.strip(), column=col, message_contains=msg_c)
+    return ExpectedError(
+        line=line, rule=sys.intern(rule.strip()), column=column, message_contains=msg_contains
+    )
+
+
+# LibYAML's C safe loader when PyYAML was built with it; same results, much faster parsing.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_via_json_sidecar(path: Path, parse: Callable[[bytes], Any]) -> Any:
+    """
+    Return parse(path's bytes), reusing a JSON sidecar copy in repo tmp/ across runs.
+
+    The sidecar is stamped with the file's resolved path, mtime and size and is reused only
+    while all three match. It is replaced atomically, and written only when the parsed data
+    survives a JSON round trip unchanged, so loading it always gives what parse() would.
+    """
+    st = path.stat()
+    stamp = [str(path.resolve()), st.st_mtime_ns, st.st_size]
+    sidecar = repo_root() / "tmp" / f"{path.name}.json"
+    try:
+        cached = _loads(sidecar.read_bytes())
+        if cached["stamp"] == stamp:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    data = parse(path.read_bytes())
+    partial = sidecar.with_name(f"{sidecar.name}.{uuid.uuid4().hex}")
+    try:
+        raw = _dumps({"stamp": stamp, "data": data})
+        if _loads(raw)["data"] == data:  # e.g. non-string keys do not survive JSON
+            sidecar.parent.mkdir(exist_ok=True)
+            partial.write_bytes(raw)
+            os.replace(partial, sidecar)
+    except (OSError, TypeError, ValueError):
+        # The sidecar is only an optimization; data that is not JSON-serializable still works.
+        partial.unlink(missing_ok=True)
+    return data
 
 
 def load_expected_errors(expect_path: Path) -> Dict[str, Any]:
-    """Load expected_errors.yml; return dict keyed by fixture filename."""
+    """
+    Load expected_errors.yml; return dict keyed by fixture filename.
+
+    The parsed result is kept in a JSON sidecar in repo tmp/ (see load_via_json_sidecar())
+    and reused by later runs while the YAML file is unchanged (JSON loads much faster).
+    """
     if not expect_path.exists():
         raise FileNotFoundError(f"Expected errors file not found: {expect_path}")
-    text = expect_path.read_text(encoding="utf-8")
+    # Raw bytes: LibYAML reads UTF-8 itself, so a str would be decoded and re-encoded.
+    return load_via_json_sidecar(
+        expect_path, lambda raw: load_expected_errors_from_text(raw, expect_path)
+    )
+
+
+def load_expected_errors_from_text(
+    text: Union[str, bytes], source: Any = "<string>"
+) -> Dict[str, Any]:
+    """
+    Parse expected_errors.yml content (str, or UTF-8 bytes); return dict keyed by fixture name.
+
+    source (e.g. the file path) is only used in error messages. Raises ValueError on invalid
+    YAML or when the top level is not a mapping.
+    """
     try:
-        data = yaml.safe_load(text)
+        data = yaml.load(text, Loader=_SafeLoader)  # nosec B506 (safe loader)
     except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML in {expect_path}: {e}") from e
+        raise ValueError(f"Invalid YAML in {source}: {e}") from e
     if not isinstance(data, dict):
-        raise ValueError(f"Expected errors file must be a YAML object: {expect_path}")
+        raise ValueError(f"Expected errors file must be a YAML object: {source}")
     return data
 
 
@@ -148,9 +263,51 @@ def parse_expectations_from_data(
     return len(parsed), parsed
 
 
-_RE_ERROR_LINE = re.compile(
-    r"^[^:]+:(\d+)(?::(\d+))?\s+(?:error\s+)?(\S+)\s+(.*)$"
-)
+@functools.lru_cache(maxsize=1)
+def _error_after_label_re() -> re.Pattern:
+    """
+    Regex for an error line after its "<file>:" prefix: line, column, rule, message.
+
+    Compiled on first use, since _split_error_line() only needs it for unusual whitespace.
+    markdownlint output is ASCII, so re.ASCII keeps the character classes off Unicode tables.
+    """
+    return re.compile(r"(\d+)(?::(\d+))?\s+(?:error\s+)?(\S+)\s+(.*)$", re.ASCII)
+
+
+def _split_error_line(line: str, start: int) -> Optional[Tuple[int, Optional[int], str, str]]:
+    """
+    Split line[start:] ("<line>[:<col>] [error ]<rule> <message>") into its four fields.
+
+    Returns (line, column, rule, message), or None if the text is not an error line. Rule
+    names are interned, so the same name from expectations and output is one shared string.
+    The usual single-space shape is scanned with str.find and slices (no regex, no copy of
+    the whole tail); anything else (tabs, repeated or other whitespace) falls back to
+    _error_after_label_re().
+    """
+    loc_end = line.find(" ", start)
+    rule_start = loc_end + 1
+    rule_end = line.find(" ", rule_start) if loc_end >= 0 else -1
+    if rule_end >= 0 and line[rule_start:rule_end] == "error":
+        rule_start = rule_end + 1
+        rule_end = line.find(" ", rule_start)
+    if rule_end >= 0:
+        line_no, colon, col = line[start:loc_end].partition(":")
+        rule = line[rule_start:rule_end]
+        if (
+            line_no.isascii()
+            and line_no.isdecimal()
+            and (not colon or (col.isascii() and col.isdecimal()))
+            and rule.split() == [rule]
+        ):
+            return (
+                int(line_no), int(col) if col else None, sys.intern(rule),
+                line[rule_end + 1:].strip(),
+            )
+    m = _error_after_label_re().match(line, start)
+    if not m:
+        return None
+    column = int(m.group(2)) if m.group(2) else None
+    return int(m.group(1)), column, sys.intern(m.group(3)), (m.group(4) or "").strip()
 
 
 def parse_markdownlint_output(output: str, file_label: str) -> List[ExpectedError]:
@@ -165,19 +322,11 @@ def parse_markdownlint_output(output: str, file_label: str) -> List[ExpectedErro
     for line in output.splitlines():
         if not line.startswith(prefix):
             continue
-        m = _RE_ERROR_LINE.match(line)
-        if not m:
+        parts = _split_error_line(line, len(prefix))
+        if parts is None:
             continue
-        column = int(m.group(2)) if m.group(2) else None
-        message = (m.group(4) or "").strip()
-        errors.append(
-            ExpectedError(
-                line=int(m.group(1)),
-                rule=m.group(3),
-                column=column,
-                message=message,
-            )
-        )
+        line_no, column, rule, message = parts
+        errors.append(ExpectedError(line=line_no, rule=rule, column=column, message=message))
     return errors
 
 
@@ -188,11 +337,7 @@ def _count_map_key(e: ExpectedError) -> Tuple[int, str, Optional[int]]:
 
 def to_count_map(errors: List[ExpectedError]) -> Dict[Tuple[int, str, Optional[int]], int]:
     """Build a multiset of (line, rule, column) -> count for comparing expected vs actual."""
-    m: Dict[Tuple[int, str, Optional[int]], int] = {}
-    for e in errors:
-        key = _count_map_key(e)
-        m[key] = m.get(key, 0) + 1
-    return m
+    return Counter(_count_map_key(e) for e in errors)
 
 
 def _assert_message_contains(
@@ -202,22 +347,21 @@ def _assert_message_contains(
     combined: str,
 ) -> None:
     """Raise AssertionError if any expected message_contains is not found in actual messages."""
+    by_line_rule: Dict[Tuple[int, str], List[ExpectedError]] = {}
+    for a in act_errors:
+        by_line_rule.setdefault((a.line, a.rule), []).append(a)
     for exp in exp_errors:
         if exp.message_contains is None:
             continue
-        candidates = [
-            a for a in act_errors
-            if a.line == exp.line and a.rule == exp.rule
-            and (exp.column is None or a.column == exp.column)
-        ]
+        candidates = by_line_rule.get((exp.line, exp.rule), [])
+        if exp.column is not None:
+            candidates = [a for a in candidates if a.column == exp.column]
         if not candidates:
             raise AssertionError(
                 f"Unexpected errors for {file_label}: no actual error at line {exp.line} "
                 f"rule {exp.rule} to check message_contains.\n\nOutput:\n{combined}\n"
             )
-        if not any(
-            (a.message or "").find(exp.message_contains) >= 0 for a in candidates
-        ):
+        if not any(exp.message_contains in (a.message or "") for a in candidates):
             raise AssertionError(
                 f"Unexpected error message for {file_label} at line {exp.line} rule {exp.rule}: "
                 f'message_contains "{exp.message_contains}" not found in actual message. '
@@ -225,6 +369,78 @@ def _assert_message_contains(
             )
 
 
+def _expectations_for(
+    file_path: Path, expectations_by_file: Dict[str, Any]
+) -> Tuple[int, List[ExpectedError]]:
+    """Return (total, errors) expected for file_path; ValueError if it has no entry."""
+    key = file_path.name
+    if key not in expectations_by_file:
+        raise ValueError(f"No expectations in expected_errors.yml for {key}")
+    return parse_expectations_from_data(expectations_by_file[key], file_path)
+
+
+def _combined_output(proc: subprocess.CompletedProcess) -> str:
+    """stdout and stderr of a markdownlint run joined by a newline, stripped."""
+    combined = (
+        (proc.stdout or "")
+        + ("\n" if proc.stdout and proc.stderr else "")
+        + (proc.stderr or "")
+    )
+    return combined.strip()
+
+
+def lint_files(cmd: List[str], file_paths: List[Path]) -> Dict[Path, Tuple[int, str]]:
+    """
+    Run markdownlint once on several fixture files; return path -> (returncode, output).
+
+    Output is streamed (stderr merged into stdout) and each line is routed to the file it
+    names, so the full output is never held as one string. Each file gets its own lines,
+    and returncode 1 if there are any, else 0. If the run itself failed (returncode other
+    than 0 or 1, or 1 with no line naming a file), every file gets that returncode and
+    the lines that named no file. Results can be checked with verify_lint_result().
+    """
+    labels = {p: fixture_label(p) for p in file_paths}
+    by_label: Dict[str, List[str]] = {label: [] for label in labels.values()}
+    other: List[str] = []
+    # No shell, preexec_fn or uid/gid changes: on Linux CPython spawns via vfork(), so the
+    # parent's memory is never copied (posix_spawn is out since it rules out cwd and pipes).
+    with subprocess.Popen(
+        [*cmd, *labels.values()],
+        cwd=repo_root(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    ) as proc:  # nosec B603 (file list and command are controlled by repository code)
+        for line in proc.stdout or ():
+            line = line.rstrip("\n")
+            by_label.get(line.partition(":")[0], other).append(line)
+        returncode = proc.wait()
+    failed = returncode not in (0, 1) or (
+        returncode == 1 and not any(by_label.values())
+    )
+    results: Dict[Path, Tuple[int, str]] = {}
+    for path, label in labels.items():
+        own = by_label[label]
+        if failed:
+            results[path] = (returncode, "\n".join(own + other).strip())
+        else:
+            results[path] = (1 if own else 0, "\n".join(own))
+    return results
+
+
+def verify_lint_result(
+    file_path: Path, expectations_by_file: Dict[str, Any], returncode: int, output: str
+) -> None:
+    """
+    Assert an existing markdownlint result for one fixture (e.g. from lint_files()).
+
+    Same checks as verify_file() without running markdownlint.
+    """
+    exp_total, exp_errors = _expectations_for(file_path, expectations_by_file)
+    file_label = fixture_label(file_path)
+    _compare_result(file_label, exp_total, exp_errors, returncode, output)
+
+
 def verify_file(
     cmd: List[str], file_path: Path, expectations_by_file: Dict[str, Any]
 ) -> None:
@@ -233,14 +449,9 @@ def verify_file(
 
     Raises AssertionError or ValueError on mismatch; OSError/SubprocessError on run failure.
     """
-    key = file_path.name
-    if key not in expectations_by_file:
-        raise ValueError(f"No expectations in expected_errors.yml for {key}")
-    exp_total, exp_errors = parse_expectations_from_data(
-        expectations_by_file[key], file_path
-    )
+    exp_total, exp_errors = _expectations_for(file_path, expectations_by_file)
 
-    file_label = file_path.relative_to(repo_root()).as_posix()
+    file_label = fixture_label(file_path)
     proc = subprocess.run(
         [*cmd, file_label],
         cwd=repo_root(),
@@ -248,24 +459,71 @@ def verify_file(
         capture_output=True,
         check=False,
     )  # nosec B603 (file list and command are controlled by repository code)
-    combined = (
-        (proc.stdout or "")
-        + ("\n" if proc.stdout and proc.stderr else "")
-        + (proc.stderr or "")
+    _compare_result(file_label, exp_total, exp_errors, proc.returncode, _combined_output(proc))
+
+
+def _assert_counts_match(
+    exp_map: Dict[Tuple[int, str, Optional[int]], int],
+    act_map: Dict[Tuple[int, str, Optional[int]], int],
+    file_label: str,
+    combined: str,
+) -> None:
+    """
+    Raise AssertionError if (line, rule) totals differ, or expected columns are missing.
+
+    Expected errors without a column match any actual column on their line and rule. All
+    missing columns are listed in one error.
+    """
+    # Per (line, rule) totals in one pass over each map; columns are checked below.
+    exp_lr: Counter = Counter()
+    act_lr: Counter = Counter()
+    for (l, r, _), c in exp_map.items():
+        exp_lr[(l, r)] += c
+    for (l, r, _), c in act_map.items():
+        act_lr[(l, r)] += c
+    first = min(
+        (k for k in exp_lr.keys() | act_lr.keys() if exp_lr[k] != act_lr[k]), default=None
     )
-    combined = combined.strip()
+    if first is not None:
+        diff_text = (
+            f"- line {first[0]} rule {first[1]}: expected {exp_lr[first]}, got {act_lr[first]}"
+        )
+        raise AssertionError(
+            f"Unexpected errors for {file_label}:\n{diff_text}\n\nOutput:\n{combined}\n"
+        )
+    missing = sorted(
+        (k, c) for k, c in exp_map.items() if k[2] is not None and c > act_map.get(k, 0)
+    )
+    if missing:
+        diff_text = "\n".join(
+            f"- line {l} rule {r} column {col}: expected {c}, got {act_map.get((l, r, col), 0)}"
+            for (l, r, col), c in missing
+        )
+        raise AssertionError(
+            f"Unexpected errors for {file_label}:\n{diff_text}\n\nOutput:\n{combined}\n"
+        )
 
-    act_errors = parse_markdownlint_output(combined, file_label)
 
+def _compare_result(
+    file_label: str,
+    exp_total: int,
+    exp_errors: List[ExpectedError],
+    returncode: int,
+    combined: str,
+) -> None:
+    """Raise AssertionError unless returncode and output match the expected errors."""
     exp_ok = not exp_total
-    act_ok = not proc.returncode
+    act_ok = not returncode
     if exp_ok != act_ok:
         want = 0 if exp_ok else "non-zero"
         raise AssertionError((
-            f"Unexpected exit code for {file_label}: expected {want}, got {proc.returncode}"
+            f"Unexpected exit code for {file_label}: expected {want}, got {returncode}"
             f"\n\nOutput:\n{combined}\n"
         ))
+    if exp_ok:
+        return  # Clean fixture and a clean run; the output has no errors to parse.
 
+    act_errors = parse_markdownlint_output(combined, file_label)
     if len(act_errors) != exp_total:
         raise AssertionError((
             f"Unexpected error count for {file_label}: expected {exp_total}, got {len(act_errors)}"
@@ -274,32 +532,61 @@ def verify_file(
 
     exp_map = to_count_map(exp_errors)
     act_map = to_count_map(act_errors)
+    if exp_map != act_map:  # Equal maps (e.g. all columns given) need no per-key diff.
+        _assert_counts_match(exp_map, act_map, file_label, combined)
 
-    def line_rule_pairs(m: Dict[Tuple[int, str, Optional[int]], int]) -> set:
-        return {(k[0], k[1]) for k in m}
+    _assert_message_contains(exp_errors, act_errors, file_label, combined)
 
-    pairs = line_rule_pairs(exp_map) | line_rule_pairs(act_map)
-    for (lr_line, lr_rule) in sorted(pairs):
-        exp_sum = sum(c for (l, r, _), c in exp_map.items() if l == lr_line and r == lr_rule)
-        act_sum = sum(c for (l, r, _), c in act_map.items() if l == lr_line and r == lr_rule)
-        if exp_sum != act_sum:
-            diff_text = (
-                f"- line {lr_line} rule {lr_rule}: expected {exp_sum}, got {act_sum}"
-            )
-            raise AssertionError(
-                f"Unexpected errors for {file_label}:\n{diff_text}\n\nOutput:\n{combined}\n"
-            )
-    for (l, r, col) in exp_map:
-        if col is not None and exp_map[(l, r, col)] > act_map.get((l, r, col), 0):
-            diff_text = (
-                f"- line {l} rule {r} column {col}: expected {exp_map[(l, r, col)]}, "
-                f"got {act_map.get((l, r, col), 0)}"
-            )
-            raise AssertionError(
-                f"Unexpected errors for {file_label}:\n{diff_text}\n\nOutput:\n{combined}\n"
-            )
 
-    _assert_message_contains(exp_errors, act_errors, file_label, combined)
+def _lint_batches(
+    cmd: List[str], file_paths: List[Path], jobs: int
+) -> Dict[Path, Tuple[int, str]]:
+    """
+    Lint file_paths in up to jobs markdownlint runs at a time; return lint_files()'s results.
+
+    Files are dealt round-robin into one batch per job, so each run pays Node startup once.
+    Threads are enough since each job waits on its markdownlint subprocess.
+    """
+    jobs = max(1, min(jobs, len(file_paths)))
+    if jobs == 1:
+        return lint_files(cmd, file_paths)
+    batches = [file_paths[i::jobs] for i in range(jobs)]
+    actual: Dict[Path, Tuple[int, str]] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for result in pool.map(lambda batch: lint_files(cmd, batch), batches):
+            actual.update(result)
+    return actual
+
+
+def verify_files(
+    cmd: List[str],
+    file_paths: List[Path],
+    expectations_by_file: Dict[str, Any],
+    jobs: int = 1,
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Lint fixtures in batches (up to jobs markdownlint runs at a time) and check each result.
+
+    Generates the long fixture first when it is listed. Yields (path, failure message or
+    None) in the order of file_paths; if markdownlint cannot be run, every file fails with
+    that error.
+    """
+    for f in file_paths:
+        if f.name == "negative_document_length.md":
+            ensure_long_document_fixture(f)
+    try:
+        actual = _lint_batches(cmd, file_paths, jobs)
+    except (OSError, subprocess.SubprocessError) as e:
+        for f in file_paths:
+            yield f, str(e)
+        return
+    for f in file_paths:
+        try:
+            verify_lint_result(f, expectations_by_file, *actual[f])
+        except (AssertionError, ValueError) as e:
+            yield f, str(e)
+        else:
+            yield f, None
 
 
 def main(quiet: bool = False) -> int:
@@ -316,8 +603,17 @@ def main(quiet: bool = False) -> int:
         action="store_true",
         help="Print each fixture as it is verified.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Lint fixtures in up to N concurrent markdownlint runs (default 0 = one per CPU).",
+    )
     args = parser.parse_args()
     verbose = args.verbose
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     cmd = find_markdownlint_cmd()
     files = list_fixture_files()
@@ -325,27 +621,20 @@ def main(quiet: bool = False) -> int:
     expectations_by_file = load_expected_errors(expect_path)
     failures: List[str] = []
 
-    for f in files:
-        if f.name == "negative_document_length.md":
-            ensure_long_document_fixture(f)
+    for f, failure in verify_files(cmd, files, expectations_by_file, jobs):
         if verbose:
             exp_total = 0
             if f.name in expectations_by_file:
                 err_list = expectations_by_file[f.name].get("errors") or []
                 exp_total = len(err_list)
-            file_label = f.relative_to(repo_root()).as_posix()
+            file_label = fixture_label(f)
             plural = "" if exp_total == 1 else "s"
+            status = "ok" if failure is None else "FAIL"
             sys.stderr.write(
-                f"Verifying {file_label} ({exp_total} expected error{plural}) ... "
+                f"Verifying {file_label} ({exp_total} expected error{plural}) ... {status}\n"
             )
-        try:
-            verify_file(cmd, f, expectations_by_file)
-            if verbose:
-                sys.stderr.write("ok\n")
-        except (AssertionError, ValueError, OSError, subprocess.SubprocessError) as e:
-            if verbose:
-                sys.stderr.write("FAIL\n")
-            failures.append(str(e))
+        if failure is not None:
+            failures.append(failure)
 
     if failures:
         sys.stderr.write(f"markdownlint fixture verification failed ({len(failures)} file(s)):\n\n")